@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
-import math
 import networkx as nx
 import numpy as np
 from sklearn.cluster import KMeans
-import json
+
+from . import serialization
+
+# Maximum TurtleBot4 velocity (units/sec), used to turn edge distances into traversal times
+TURTLEBOT4_MAX_VELOCITY = 0.31
 
 def load_full_graph(graph_path: str) -> nx.MultiGraph:
     """
@@ -34,8 +37,9 @@ def load_full_graph(graph_path: str) -> nx.MultiGraph:
     - nx.MultiGraph: A NetworkX MultiGraph object representing the navigation graph.
     """
     # Open and read the JSON file containing the graph data
-    with open(graph_path, 'r') as f:
-        data = json.load(f)
+    # (parsed with the fastest available JSON backend, see `serialization`)
+    with open(graph_path, 'rb') as f:
+        data = serialization.loads(f.read())
     # Utilize the helper function to construct the graph from the loaded data
     return load_full_graph_from_data(data)
 
@@ -57,26 +61,38 @@ def load_full_graph_from_data(graph_data):
     # Initialize an empty MultiGraph
     G = nx.MultiGraph()
 
-    # Iterate over each node in the 'nodes' list of the graph data
-    for node in graph_data['nodes']:
-        label = node['label']      # Unique identifier for the node
-        x = node['x']              # X-coordinate in the navigation space
-        y = node['y']              # Y-coordinate in the navigation space
-        # Add the node to the graph with its attributes
-        G.add_node(label, x=x, y=y)
-
-    # Iterate over each edge in the 'edges' list of the graph data
-    for edge in graph_data['edges']:
-        u = edge['source']         # Source node label
-        v = edge['target']         # Target node label
-        distance = edge.get('distance', 1.0)  # Distance between nodes; default to 1.0 if not provided
-        turtlebot4_max_velocity=0.31
-        weight = distance / turtlebot4_max_velocity   # Calculate traversal time based on a fixed speed (0.31 units/sec)
-        # Add the edge to the graph with the computed weight
-        G.add_edge(u, v, weight=weight)
+    # Add all the nodes in one call, each with its coordinates in the navigation space
+    G.add_nodes_from(
+        (node['label'], {'x': node['x'], 'y': node['y']}) for node in graph_data['nodes']
+    )
+
+    # Add all the edges in one call. The 'weight' is the traversal time based on a fixed
+    # speed (0.31 units/sec); the distance defaults to 1.0 if not provided
+    G.add_edges_from(
+        (edge['source'], edge['target'], {'weight': edge.get('distance', 1.0) / TURTLEBOT4_MAX_VELOCITY})
+        for edge in graph_data['edges']
+    )
 
     return G  # Return the constructed MultiGraph
 
+
+def make_edge_key(u, v):
+    """
+    Returns the canonical key of the undirected edge between `u` and `v`.
+
+    The key is the ordered pair of node labels, so both traversal directions map to the same
+    entry in `occupied_edges`/`edge_occupants`. Equivalent to `tuple(sorted([u, v]))`, without
+    allocating and sorting a temporary list on every lookup.
+
+    Parameters:
+    - u (str): Label of one endpoint.
+    - v (str): Label of the other endpoint.
+
+    Returns:
+    - tuple: `(u, v)` if `u <= v`, otherwise `(v, u)`.
+    """
+    return (u, v) if u <= v else (v, u)
+
 ###
 #This function is used if we want to use an other strategy to partition the graph divided by the slaves during the visit. We divide
 #the graph in a number of subgraphs characterized by the number of slaves in the network and then we assign each cpp route on each 
@@ -101,56 +117,55 @@ def partition_graph(full_graph: nx.MultiGraph, num_partitions: int):
         - A subgraph (nx.MultiGraph) representing a cluster.
         - A starting node label (str) for that subgraph.
     """
-    # Extract all node labels from the full graph
-    node_labels = list(full_graph.nodes())
-    
-    # Create a NumPy array of node positions for clustering
-    positions = np.array([
-        [full_graph.nodes[node]['x'], full_graph.nodes[node]['y']] for node in node_labels
-    ])
+    # Flatten the graph into parallel arrays once (node labels, (N, 2) positions and
+    # endpoint indices of every edge), so the per-cluster work below runs on integer
+    # indices instead of walking the NetworkX attribute dictionaries for every cluster
+    node_labels = list(full_graph.nodes)
+    # Coordinates are streamed straight into a contiguous float64 buffer, without building
+    # an intermediate list of (x, y) tuples
+    positions = np.fromiter(
+        (coord for _, data in full_graph.nodes(data=True) for coord in (data['x'], data['y'])),
+        dtype=np.float64,
+        count=2 * len(node_labels),
+    ).reshape(-1, 2)
+    label_to_idx = {label: idx for idx, label in enumerate(node_labels)}
+
+    edge_list = list(full_graph.edges(data=True))
+    edge_idx = [(label_to_idx[u], label_to_idx[v]) for u, v, _ in edge_list]
     
     # Initialize K-Means clustering with the desired number of partitions
     kmeans = KMeans(n_clusters=num_partitions, random_state=42)
     # Perform clustering and obtain cluster labels for each node
     labels = kmeans.fit_predict(positions)
     
-    # Organize nodes into clusters based on their assigned labels
-    clusters = {}
-    for node_label, clab in zip(node_labels, labels):
-        clusters.setdefault(clab, set()).add(node_label)
-    
     subgraphs_with_start = []  # List to store subgraphs and their starting nodes
 
-    # Iterate over each cluster to construct subgraphs
-    for cluster_idx, cluster_nodes in clusters.items():
-        sg_nodes = set(cluster_nodes)  # Nodes belonging to the current cluster
-        edges = []  # List to store edges within the cluster
+    # Iterate over each cluster (in order of first appearance) to construct subgraphs
+    for cluster_idx in dict.fromkeys(labels.tolist()):
+        in_sg = (labels == cluster_idx).tolist()  # Node membership flags, by node index
+        sg_edges = []  # Indices of the edges within the cluster
 
         # Iterate over all edges in the full graph
-        for u, v, data in full_graph.edges(data=True):
+        for i, (u, v) in enumerate(edge_idx):
             # Check if either node of the edge belongs to the current cluster
-            if u in sg_nodes or v in sg_nodes:
-                edges.append((u, v, data))  # Add the edge to the cluster's edge list
-                sg_nodes.update([u, v])     # Ensure both nodes are included in the cluster
+            if in_sg[u] or in_sg[v]:
+                sg_edges.append(i)                 # Add the edge to the cluster's edge list
+                in_sg[u] = in_sg[v] = True         # Ensure both nodes are included in the cluster
+        sg_idx = np.flatnonzero(in_sg)
         
-        # Initialize a new MultiGraph for the current cluster
+        # Initialize a new MultiGraph for the current cluster with the nodes and edges
+        # (and their attributes) selected above
         sg = nx.MultiGraph()
-        # Add all nodes in the cluster to the subgraph with their attributes
-        for n in sg_nodes:
-            sg.add_node(n, **full_graph.nodes[n])
-        # Add all relevant edges to the subgraph with their attributes
-        for (u, v, d) in edges:
-            sg.add_edge(u, v, **d)
+        sg.add_nodes_from((node_labels[i], full_graph.nodes[node_labels[i]]) for i in sg_idx)
+        sg.add_edges_from(edge_list[i] for i in sg_edges)
         
         # Determine the centroid of the current cluster from K-Means results
         centroid = kmeans.cluster_centers_[cluster_idx]
-        # Calculate the Euclidean distance of each node in the subgraph to the centroid
-        distances = {node: math.hypot(full_graph.nodes[node]['x'] - centroid[0],
-                                     full_graph.nodes[node]['y'] - centroid[1]) for node in sg.nodes()}
         # Select the node closest to the centroid as the starting node for this subgraph
-        starting_node = min(distances, key=distances.get)
+        offsets = positions[sg_idx] - centroid
+        starting_node = node_labels[sg_idx[np.argmin(np.hypot(offsets[:, 0], offsets[:, 1]))]]
         
         # Append the subgraph and its starting node to the result list
         subgraphs_with_start.append((sg, starting_node))
     
-    return subgraphs_with_start  # Return the list of subgraphs with their starting nodes
\ No newline at end of file
+    return subgraphs_with_start  # Return the list of subgraphs with their starting nodes
@@ -1,3 +1,4 @@
+from rclpy.serialization import serialize_message
 from std_msgs.msg import String
 
 class HeartbeatManager:
@@ -29,9 +30,15 @@ class HeartbeatManager:
         """
         self.node = node  # Reference to the ROS2 node
         self.heartbeat_topic = heartbeat_topic
-        self.qos_profile = qos_profile  # Use the shared QoSProfile
+        self.qos_profile = qos_profile  # Use the heartbeat QoSProfile provided by the node
         self.heartbeat_publisher = self.node.create_publisher(String, self.heartbeat_topic, self.qos_profile)
         self.heartbeat_timer = None  # Timer will be initialized in start_publishing()
+
+        # The heartbeat payload never changes, so the message is built and serialized (CDR) once;
+        # every tick publishes the raw bytes, skipping the Python-to-C message conversion.
+        heartbeat_msg = String()
+        heartbeat_msg.data = "alive"
+        self.heartbeat_msg = serialize_message(heartbeat_msg)
         
     def start_publishing(self):
         """
@@ -58,8 +65,7 @@ class HeartbeatManager:
         Publishes a heartbeat message to indicate that the master node is active.
         
         This method is periodically called by the ROS2 timer set during start_publishing().
+        The pre-serialized `heartbeat_msg` is published as-is, so no allocation or conversion
+        happens per tick.
         """
-        heartbeat_msg = String()
-        heartbeat_msg.data = "alive"
-        self.heartbeat_publisher.publish(heartbeat_msg)
-        self.node.get_logger().debug("Published master heartbeat.")
+        self.heartbeat_publisher.publish(self.heartbeat_msg)
@@ -1,8 +1,16 @@
-import json
+import heapq
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from rclpy.logging import LoggingSeverity
+from rclpy.serialization import serialize_message
 from std_msgs.msg import String
 
 from .slave_state import SlaveState
+from .graph_utils import make_edge_key
 from .path_calculation import calculate_undirected_cpp_route
+from . import serialization
 
 class MasterCallbacks:
     """
@@ -31,6 +39,21 @@ class MasterCallbacks:
         self.global_cpp_route = []  # Will contain the common Eulerian route for navigation.
         self.first_waypoint_phase = True  # Indicates if in the initial phase of assigning the first waypoint.
         self.slaves_reached_first = set()  # Tracks slave robots that have reached the first waypoint.
+        self.navigation_graph_msg = None  # Cached CDR-serialized graph; rebuilt only when the graph changes.
+        self.slave_command_publishers = {}  # navigation_commands publishers, kept across slave re-registrations.
+        # Min-heap of (last_seen_time + timeout, slave_ns). Entries are pushed on every heartbeat
+        # and discarded lazily, so a timeout check only visits the entries that have expired.
+        self.slave_deadlines = []
+        # Resolved once, so periodic callbacks skip formatting debug messages that would be discarded.
+        self.debug_logging = self.get_logger().is_enabled_for(LoggingSeverity.DEBUG)
+        # The CPP route is computed on a worker thread, so the executor keeps serving heartbeats
+        # meanwhile; the guard condition hands the result back to the executor thread.
+        self.cpp_route_executor = ThreadPoolExecutor(max_workers=1)
+        self.cpp_route_future = None
+        # Callbacks of different groups may request the route concurrently (e.g. a slave's
+        # become_master and its registration callback): the lock makes check-and-submit atomic.
+        self.cpp_route_lock = Lock()
+        self.cpp_route_guard = self.create_guard_condition(self.on_global_cpp_route_ready)
 
     def publish_navigation_graph(self):
         """
@@ -42,6 +65,30 @@ class MasterCallbacks:
 
         The 'weight' attribute of each edge is used to represent traversal time,
         calculated as distance divided by a constant speed factor (0.31 units/sec).
+
+        The graph is static between topology changes, so the message is built and serialized
+        (CDR) once and cached in `self.navigation_graph_msg`; subsequent calls only publish
+        the raw bytes, without converting the (large) string again.
+        Code that replaces or mutates `self.full_graph` must reset the cache to None and
+        publish again: the topic is latched, so only the last published graph reaches
+        late subscribers.
+        """
+        if self.navigation_graph_msg is None:
+            self.navigation_graph_msg = serialize_message(self.build_navigation_graph_msg())
+
+        # Publish the serialized graph message.
+        self.graph_publisher.publish(self.navigation_graph_msg)
+
+        # Log the publishing action at DEBUG level.
+        if self.debug_logging:
+            self.get_logger().debug("Navigation graph published.")
+
+    def build_navigation_graph_msg(self):
+        """
+        Serializes `self.full_graph` into a `std_msgs/String` message.
+
+        Returns:
+        - std_msgs.msg.String: The message containing the JSON-encoded nodes and edges.
         """
         # Initialize a String message for the graph.
         graph_msg = String()
@@ -73,47 +120,80 @@ class MasterCallbacks:
                 })
 
         # Serialize the graph data to JSON and assign it to the message.
-        graph_msg.data = json.dumps(graph_data)
+        graph_msg.data = serialization.dumps(graph_data)
+        return graph_msg
 
-        # Publish the serialized graph message.
-        self.graph_publisher.publish(graph_msg)
+    def compute_global_cpp_route(self):
+        """
+        Starts the calculation of the global Closed Path Planning (CPP) route on the navigation graph.
 
-        # Log the publishing action at DEBUG level.
-        self.get_logger().debug("Navigation graph published.")
+        The route (`self.global_cpp_route`) is a list of waypoints representing an Eulerian circuit
+        that traverses each edge exactly once, computed by `calculate_undirected_cpp_route`.
 
-    def compute_global_cpp_route(self):
+        The calculation is CPU-bound, so it runs on `self.cpp_route_executor` over a copy of the
+        graph and this method returns immediately. When it completes, `on_global_cpp_route_ready`
+        installs the route on the executor thread and (re)assigns the waypoints to the slaves.
+        A request made while a calculation is already running is merged into it.
         """
-        Calculates the global Closed Path Planning (CPP) route on the navigation graph.
+        with self.cpp_route_lock:
+            if self.cpp_route_future is not None:
+                return
+            if self.full_graph is None:
+                self.get_logger().warn("No navigation graph loaded: cannot compute the global CPP route.")
+                return
 
-        This method generates a list of waypoints (`self.global_cpp_route`) representing an Eulerian circuit
-        that traverses each edge exactly once. It uses the `calculate_undirected_cpp_route`
-        function to compute this route based on the nodes and the navigation graph.
+            # The route calculation adds the matching edges to the graph: work on a copy, which
+            # replaces `self.full_graph` once the route is ready.
+            graph = self.full_graph.copy()
+            logger = self.get_logger()
+            future = self.cpp_route_executor.submit(
+                lambda: (calculate_undirected_cpp_route([], graph, logger), graph)
+            )
+            self.cpp_route_future = future
+        future.add_done_callback(lambda _: self.cpp_route_guard.trigger())
 
-        If a valid Eulerian circuit is found, it logs the calculated route. Otherwise, it logs an error.
+    def on_global_cpp_route_ready(self):
         """
-        waypoints = []
+        Guard condition callback, run on the executor thread once the CPP route calculation
+        started by `compute_global_cpp_route` has completed.
 
-        # Extract waypoint information from each node in the graph.
-        for node, data in self.full_graph.nodes(data=True):
-            waypoint = {
-                'label': node,
-                'x': data['x'],
-                'y': data['y']
-            }
-            waypoints.append(waypoint)
+        Installs the route and the augmented graph, republishes the graph, logs the result and
+        starts repartitioning and assigning the waypoints.
+        """
+        with self.cpp_route_lock:
+            future = self.cpp_route_future
+            if future is None or not future.done():
+                return
+            self.cpp_route_future = None
 
-        # Calculate the CPP route using the provided path calculation utility.
-        route_nodes = calculate_undirected_cpp_route(waypoints, self.full_graph, self.get_logger())
+        try:
+            route_nodes, graph = future.result()
+        except Exception as e:
+            self.get_logger().error(f"Global CPP route calculation failed: {e}")
+            return
 
-        # Assign the calculated route to the class attribute.
+        # Assign the calculated route (and the graph it was computed on) to the class attributes.
         self.global_cpp_route = route_nodes
+        self.full_graph = graph
+
+        # The route calculation adds the matching edges to the graph, so the cached
+        # serialized graph is stale: rebuild it and republish, so that the durable
+        # /navigation_graph topic hands the augmented graph to late joiners.
+        self.navigation_graph_msg = None
+        self.publish_navigation_graph()
 
         # Log the result of the route calculation.
         if self.global_cpp_route:
-            self.get_logger().info(f"Global CPP route computed: {self.global_cpp_route}")
+            # One summary line; the full route (one entry per traversal) only at DEBUG level.
+            self.get_logger().info(f"Global CPP route computed: {len(self.global_cpp_route)} waypoints.")
+            if self.debug_logging:
+                self.get_logger().debug(f"Global CPP route: {self.global_cpp_route}")
         else:
             self.get_logger().error("Global CPP route is empty or Euler circuit not found.")
 
+        # Distribute the route among the slaves registered in the meantime.
+        self.waypoint_manager.repartition_and_assign_waypoints()
+
     def slave_registration_callback(self, msg):
         """
         Callback that handles the registration of a new slave robot.
@@ -125,31 +205,40 @@ class MasterCallbacks:
         1. Extracts the slave's namespace from the incoming message.
         2. Checks if the slave is already registered.
            - If not registered:
-             a. Creates a publisher to send navigation commands to the slave.
+             a. Gets the publisher to send navigation commands to the slave, creating it only
+                the first time this namespace registers (a slave removed after a timeout
+                reuses its publisher when it comes back).
              b. Initializes an instance of `SlaveState` to track the slave's state.
              c. Adds the slave to the master's slave dictionary.
-             d. Calculates the global CPP route if it hasn't been done already.
-             e. Starts repartitioning and assigning waypoints.
+             d. Starts calculating the global CPP route if it hasn't been done already
+                (waypoints are then assigned when it is ready); otherwise starts
+                repartitioning and assigning waypoints.
            - If already registered:
              a. Updates the slave's last seen time to prevent timeouts.
 
         Parameters:
         - msg (std_msgs.msg.String): The incoming message containing the slave's namespace.
         """
-        # Extract the slave's namespace from the message, stripping any whitespace.
-        slave_ns = msg.data.strip()
+        # Extract the slave's namespace from the message. Slaves reject namespaces with whitespace
+        # at start-up and publish them verbatim, so no stripping is needed. Interning makes every
+        # registration of the same slave share one string, so lookups in `self.slaves` match the
+        # stored key by identity.
+        slave_ns = sys.intern(msg.data)
 
         # Get the current time in seconds from the ROS2 clock.
         current_time = self.get_clock().now().nanoseconds / 1e9
 
         # Check if the slave is already registered.
         if slave_ns not in self.slaves:
-            # Create a ROS2 publisher to send navigation commands to this slave.
-            publisher = self.create_publisher(String, f"/{slave_ns}/navigation_commands", self.qos_profile)
+            # Reuse the navigation commands publisher for this slave, or create it on first registration.
+            publisher = self.slave_command_publishers.get(slave_ns)
+            if publisher is None:
+                publisher = self.create_publisher(String, f"/{slave_ns}/navigation_commands", self.qos_profile)
+                self.slave_command_publishers[slave_ns] = publisher
 
             # Initialize a new SlaveState instance to track the slave's state and communication.
             slave_state = SlaveState(slave_ns, publisher)
-            slave_state.last_seen_time = current_time  # Record the registration time.
+            self.touch_slave(slave_state, current_time)  # Record the registration time.
 
             # Add the new slave to the master's slave tracking dictionary.
             self.slaves[slave_ns] = slave_state
@@ -157,17 +246,53 @@ class MasterCallbacks:
             # Log the successful registration of the new slave.
             self.get_logger().info(f"Registered new slave: {slave_ns}")
 
-            # If the global CPP route has not been calculated yet, calculate it now.
+            # If the global CPP route has not been calculated yet, calculate it now: the
+            # waypoints are assigned once it is ready.
             if not self.global_cpp_route:
                 self.compute_global_cpp_route()
-
-            # Start repartitioning and assigning waypoints to the slave robots.
-            self.waypoint_manager.repartition_and_assign_waypoints()
+            else:
+                # Start repartitioning and assigning waypoints to the slave robots.
+                self.waypoint_manager.repartition_and_assign_waypoints()
 
         else:
             # If the slave is already registered, update its last seen time to prevent timeouts.
-            self.slaves[slave_ns].last_seen_time = current_time
-            self.get_logger().debug(f"Updated last seen time for slave: {slave_ns}")
+            self.touch_slave(self.slaves[slave_ns], current_time)
+            if self.debug_logging:
+                self.get_logger().debug(f"Updated last seen time for slave: {slave_ns}")
+
+    def touch_slave(self, slave_state, current_time):
+        """
+        Records a sign of life from a slave and schedules its timeout deadline.
+
+        Parameters:
+        - slave_state (SlaveState): The slave that has just been heard from.
+        - current_time (float): The current ROS2 clock time, in seconds.
+        """
+        slave_state.last_seen_time = current_time
+        heapq.heappush(self.slave_deadlines, (current_time + self.timeout, slave_state.slave_ns))
+
+    def pop_timed_out_slaves(self, current_time):
+        """
+        Returns the namespaces of the registered slaves that have exceeded `self.timeout`.
+
+        Only the expired heap entries are visited. An entry is stale (and simply dropped) when
+        the slave has been removed in the meantime or has sent a newer heartbeat, which pushed
+        a later deadline for it.
+
+        Parameters:
+        - current_time (float): The current ROS2 clock time, in seconds.
+
+        Returns:
+        - list[str]: The timed-out slave namespaces, each reported once.
+        """
+        timed_out = []
+        while self.slave_deadlines and self.slave_deadlines[0][0] < current_time:
+            _, slave_ns = heapq.heappop(self.slave_deadlines)
+            slave = self.slaves.get(slave_ns)
+            if (slave is not None and slave_ns not in timed_out
+                    and current_time - slave.last_seen_time > self.timeout):
+                timed_out.append(slave_ns)
+        return timed_out
 
     def navigation_status_callback(self, msg):
         """
@@ -186,7 +311,7 @@ class MasterCallbacks:
         """
         try:
             # Parse the incoming JSON message.
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             slave_ns = data['robot_namespace']
             status = data['status']
             current_wpt = data['current_waypoint']
@@ -195,11 +320,11 @@ class MasterCallbacks:
 
             # Normalize the traversed edge as a sorted tuple to ensure consistency.
             if len(traversed) == 2:
-                edge_key = tuple(sorted(traversed))
+                edge_key = make_edge_key(*traversed)
             else:
                 edge_key = None
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (serialization.JSONDecodeError, KeyError) as e:
             # Log an error if the message is malformed or required fields are missing.
             self.get_logger().error(f"Invalid navigation status message: {e}")
             return
@@ -217,9 +342,10 @@ class MasterCallbacks:
         if status == "ready":
             # If the slave still has an occupied edge, ignore redundant 'ready' statuses.
             if slave.current_edge is not None:
-                self.get_logger().debug(
-                    f"[READY] Slave '{slave_ns}' still has current_edge={slave.current_edge}. Ignoring extra 'ready'."
-                )
+                if self.debug_logging:
+                    self.get_logger().debug(
+                        f"[READY] Slave '{slave_ns}' still has current_edge={slave.current_edge}. Ignoring extra 'ready'."
+                    )
                 return
 
             # If the slave was not already ready, mark it as ready.
@@ -231,7 +357,8 @@ class MasterCallbacks:
                 self.waypoint_manager.repartition_and_assign_waypoints()
             else:
                 # If the slave was already marked as ready, log at DEBUG level.
-                self.get_logger().debug(f"Slave '{slave_ns}' was already ready.")
+                if self.debug_logging:
+                    self.get_logger().debug(f"Slave '{slave_ns}' was already ready.")
 
         elif status == "reached":
             # Log the successful arrival of the slave at a waypoint.
@@ -241,17 +368,19 @@ class MasterCallbacks:
             if edge_key:
                 # Log the traversed edge.
                 # self.get_logger().info(f"Traversed edge: {edge_key}")
-                self.get_logger().info(
-                    f"Current occupied edges before freeing: {self.occupied_edges}"
-                )
+                if self.debug_logging:
+                    self.get_logger().debug(
+                        f"Current occupied edges before freeing: {self.occupied_edges}"
+                    )
                 if edge_key in self.occupied_edges:
                     # Remove the edge from the set of occupied edges.
                     self.occupied_edges.remove(edge_key)
                     # Remove the mapping of the occupying slave for this edge.
                     occupant = self.edge_occupants.pop(edge_key, None)
-                    self.get_logger().info(
-                        f"Edge {edge_key} freed by slave '{slave_ns}'. (Previously occupant={occupant})"
-                    )
+                    if self.debug_logging:
+                        self.get_logger().debug(
+                            f"Edge {edge_key} freed by slave '{slave_ns}'. (Previously occupant={occupant})"
+                        )
                 else:
                     # Warn if the edge was not marked as occupied.
                     if edge_key[0] != edge_key[1]:
@@ -286,9 +415,10 @@ class MasterCallbacks:
 
         elif status == "traversing":
             # Log that the slave is currently traversing toward a waypoint.
-            self.get_logger().debug(
-                f"Slave '{slave_ns}' is traversing toward '{current_wpt}'."
-            )
+            if self.debug_logging:
+                self.get_logger().debug(
+                    f"Slave '{slave_ns}' is traversing toward '{current_wpt}'."
+                )
             # Add any additional status updates or actions here.
 
         else:
@@ -308,15 +438,16 @@ class MasterCallbacks:
         """
         # Attempt to decode the JSON message.
         try:
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             slave_ns = data['robot_namespace']
-        except (json.JSONDecodeError, KeyError):
+        except (serialization.JSONDecodeError, KeyError):
             self.get_logger().error("Invalid /first_waypoint_reached message (JSON or missing keys).")
             return
 
         # If not waiting for first waypoints, ignore the notification.
         if not self.waiting_for_first_waypoints:
-            self.get_logger().debug(f"Ignoring notification from {slave_ns}, not waiting anymore.")
+            if self.debug_logging:
+                self.get_logger().debug(f"Ignoring notification from {slave_ns}, not waiting anymore.")
             return
 
         # Check if the slave exists.
@@ -3,7 +3,8 @@
 import os
 import rclpy
 from rclpy.node import Node
-from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
+from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy, HistoryPolicy
+from rclpy.duration import Duration
 from std_msgs.msg import String
 
 from .master_callbacks import MasterCallbacks
@@ -70,21 +71,50 @@ class MasterNavigationNode(Node, MasterCallbacks):
             durability=DurabilityPolicy.VOLATILE
         )
 
+        # Heartbeats only matter for their freshness: keep just the latest one, best effort.
+        # Slaves subscribe to '/master_heartbeat' with the same profile; the offered deadline
+        # lets them be notified by DDS as soon as heartbeats stop.
+        self.heartbeat_qos_profile = QoSProfile(
+            depth=1,
+            reliability=ReliabilityPolicy.BEST_EFFORT,
+            durability=DurabilityPolicy.VOLATILE,
+            deadline=Duration(seconds=2.0)
+        )
+
+        # Registrations are resent every second by each slave, so a lost one is harmless:
+        # best effort avoids acknowledgements/retransmissions. All slaves share the topic,
+        # hence a small queue rather than a single slot.
+        self.registration_qos_profile = QoSProfile(
+            depth=10,
+            reliability=ReliabilityPolicy.BEST_EFFORT,
+            durability=DurabilityPolicy.VOLATILE
+        )
+
+        # The navigation graph is static: it is published once, and the durable, latest-only
+        # profile makes DDS hand it to slaves that subscribe later, so no periodic republishing
+        # is needed. Slaves subscribe with the same profile.
+        self.graph_qos_profile = QoSProfile(
+            depth=1,
+            history=HistoryPolicy.KEEP_LAST,
+            reliability=ReliabilityPolicy.RELIABLE,
+            durability=DurabilityPolicy.TRANSIENT_LOCAL
+        )
+
         # ---------------------------
         # Publisher and Subscriber Setup
         # ---------------------------
         self.graph_publisher = self.create_publisher(
             String,
             '/navigation_graph',
-            self.qos_profile
+            self.graph_qos_profile
         )
-        self.graph_timer = self.create_timer(1.0, self.publish_navigation_graph)
+        self.publish_navigation_graph()
 
         self.slave_registration_subscriber = self.create_subscription(
             String,
             '/slave_registration',
             self.slave_registration_callback,
-            self.qos_profile
+            self.registration_qos_profile
         )
 
         self.navigation_status_subscriber = self.create_subscription(
@@ -97,8 +127,8 @@ class MasterNavigationNode(Node, MasterCallbacks):
         # ---------------------------
         # Manager Initialization
         # ---------------------------
-        # Pass the shared QoSProfile to HeartbeatManager
-        self.heartbeat_manager = HeartbeatManager(self, self.qos_profile)
+        # Pass the heartbeat QoSProfile to HeartbeatManager
+        self.heartbeat_manager = HeartbeatManager(self, self.heartbeat_qos_profile)
         self.heartbeat_manager.start_publishing()
         
         self.waypoint_manager = WaypointManager(self)
@@ -129,14 +159,10 @@ class MasterNavigationNode(Node, MasterCallbacks):
         Identifies and removes slaves that have exceeded the heartbeat timeout.
         """
         current_time = self.get_clock().now().nanoseconds / 1e9
-        slaves_to_remove = []
-
-        for slave_ns, slave in self.slaves.items():
-            if current_time - slave.last_seen_time > self.timeout:
-                self.get_logger().warn(f"Slave {slave_ns} has timed out. Removing from active slaves.")
-                slaves_to_remove.append(slave_ns)
+        slaves_to_remove = self.pop_timed_out_slaves(current_time)
 
         for slave_ns in slaves_to_remove:
+            self.get_logger().warn(f"Slave {slave_ns} has timed out. Removing from active slaves.")
             if slave_ns in self.slaves:
                 s = self.slaves[slave_ns]
                 if s.current_edge is not None and s.current_edge in self.occupied_edges:
@@ -156,7 +182,8 @@ class MasterNavigationNode(Node, MasterCallbacks):
         """
         Periodic callback for maintenance tasks such as checking timeouts and assigning waiting waypoints.
         """
-        self.get_logger().debug("Master timer callback triggered.")
+        if self.debug_logging:
+            self.get_logger().debug("Master timer callback triggered.")
         self.check_slaves_timeout()
         self.waypoint_manager.assign_waiting_slaves()
 
@@ -173,6 +200,14 @@ class MasterNavigationNode(Node, MasterCallbacks):
         """
         self.waypoint_manager.repartition_and_assign_waypoints()
 
+    def destroy_node(self):
+        """
+        Stops the CPP route worker, then destroys this node.
+        """
+        # Do not wait for a CPP route calculation that is still running
+        self.cpp_route_executor.shutdown(wait=False)
+        super().destroy_node()
+
 
 def main(args=None):
     rclpy.init(args=args)
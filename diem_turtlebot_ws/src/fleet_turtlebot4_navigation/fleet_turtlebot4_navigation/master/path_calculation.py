@@ -1,4 +1,84 @@
+from collections import OrderedDict
+
 import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# Maximum number of CPP routes kept in the memoization cache.
+CPP_ROUTE_CACHE_SIZE = 64
+
+# Memoized CPP routes, keyed by graph signature (see `graph_signature`).
+# Each entry stores the route and the edges that were added to make the graph Eulerian.
+_cpp_route_cache = OrderedDict()
+
+
+def graph_signature(subgraph: nx.MultiGraph):
+    """
+    Computes a hashable signature identifying the topology and weights of a graph.
+
+    Two graphs with the same signature yield the same CPP route, so the signature is
+    used as the key of the route memoization cache.
+
+    Parameters:
+        subgraph (networkx.MultiGraph): The graph to describe.
+
+    Returns:
+        tuple: (sorted node labels, sorted (u, v, weight) edge tuples).
+    """
+    nodes = tuple(sorted(subgraph.nodes()))
+    edges = tuple(sorted(
+        (min(u, v), max(u, v), w) for u, v, w in subgraph.edges(data='weight', default=1)
+    ))
+    return nodes, edges
+
+
+def odd_node_distances(subgraph: nx.MultiGraph, odd_degree_nodes):
+    """
+    Computes the shortest path distances between every pair of odd-degree nodes.
+
+    The subgraph is flattened once into a CSR adjacency matrix (keeping the lightest of any
+    parallel edges) and the searches run in SciPy's compiled Dijkstra, one source per
+    odd-degree node, instead of walking the NetworkX dictionaries from Python.
+
+    Parameters:
+        subgraph (networkx.MultiGraph): The graph the distances are measured on.
+        odd_degree_nodes (list): The labels of the odd-degree nodes.
+
+    Returns:
+        dict: {u: {v: distance}} for each pair of odd-degree nodes connected by a path.
+    """
+    node_index = {node: idx for idx, node in enumerate(subgraph.nodes())}
+
+    # Lightest weight between each pair of distinct endpoints (self-loops never shorten a path)
+    lightest = {}
+    for u, v, w in subgraph.edges(data='weight', default=1):
+        if u == v:
+            continue
+        key = (node_index[u], node_index[v]) if node_index[u] < node_index[v] else (node_index[v], node_index[u])
+        if key not in lightest or w < lightest[key]:
+            lightest[key] = w
+
+    if lightest:
+        pairs = np.array(list(lightest.keys()), dtype=np.int64)
+        rows, cols = pairs[:, 0], pairs[:, 1]
+        weights = np.fromiter(lightest.values(), dtype=np.float64, count=len(lightest))
+    else:
+        rows = cols = np.empty(0, dtype=np.int64)
+        weights = np.empty(0, dtype=np.float64)
+    adjacency = csr_matrix((weights, (rows, cols)), shape=(len(node_index), len(node_index)))
+
+    odd_idx = [node_index[node] for node in odd_degree_nodes]
+    dist_matrix = dijkstra(adjacency, directed=False, indices=odd_idx)[:, odd_idx]
+
+    return {
+        u: {
+            v: float(dist_matrix[i, j])
+            for j, v in enumerate(odd_degree_nodes)
+            if np.isfinite(dist_matrix[i, j])
+        }
+        for i, u in enumerate(odd_degree_nodes)
+    }
 
 
 def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
@@ -39,6 +119,10 @@ def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
             An ordered list of node labels representing the route that covers all edges of the subgraph 
             at least once. Example:
                 ['node_1', 'node_2', 'node_3', 'node_1']
+
+    Routes are memoized per graph signature: when the same graph is seen again the cached
+    route is returned and the cached matching edges are re-added to the subgraph, exactly
+    as a fresh computation would do.
     """
     # ---------------------------
     # Step 1: Validate Subgraph Type
@@ -49,6 +133,19 @@ def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
         logger.error(f"The graph is not a MultiGraph, but a {type(subgraph)}. Cannot compute DCPP.")
         return []
 
+    # Reuse a previously computed route for an identical graph.
+    signature = graph_signature(subgraph)
+    cached = _cpp_route_cache.get(signature)
+    if cached is not None:
+        _cpp_route_cache.move_to_end(signature)
+        cached_route, cached_added_edges = cached
+        for u, v, weight in cached_added_edges:
+            subgraph.add_edge(u, v, weight=weight)
+        return list(cached_route)
+
+    # Edges added to make the graph Eulerian (stored alongside the route in the cache).
+    added_edges = []
+
     # ---------------------------
     # Step 2: Identify Odd-Degree Nodes
     # ---------------------------
@@ -78,21 +175,24 @@ def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
         # Since the graph is not Eulerian, we need to make it Eulerian by pairing up the odd-degree nodes
         # and adding the shortest possible paths between them. This ensures that all nodes have even degrees.
 
+        # Shortest path distances between the odd-degree nodes, computed in one batch (see
+        # `odd_node_distances`). The table is reused below when duplicating the matched paths.
+        odd_distances = odd_node_distances(subgraph, odd_degree_nodes)
+
         # Create a complete graph of the odd-degree nodes where the edge weights represent the shortest path distances.
         odd_complete = nx.Graph()
 
-        # Iterate over all unique pairs of odd-degree nodes to calculate the shortest path distances between them.
+        # Iterate over all unique pairs of odd-degree nodes to collect the shortest path distances between them.
         for i, u in enumerate(odd_degree_nodes):
+            distances_from_u = odd_distances[u]
             for v in odd_degree_nodes[i + 1:]:
-                try:
-                    # Calculate the length of the shortest path between nodes u and v, using edge weights.
-                    dist = nx.shortest_path_length(subgraph, source=u, target=v, weight='weight')
-                    # Add an edge between u and v in the complete graph with the distance as the weight.
-                    odd_complete.add_edge(u, v, weight=dist)
-                except nx.NetworkXNoPath:
+                dist = distances_from_u.get(v)
+                if dist is None:
                     # If there is no path between u and v, log an error and skip this pair.
                     logger.error(f"No path between {u} and {v} in the subgraph.")
                     continue
+                # Add an edge between u and v in the complete graph with the distance as the weight.
+                odd_complete.add_edge(u, v, weight=dist)
 
         # Check if the complete graph has any edges; if not, it's impossible to perform matching.
         if odd_complete.number_of_edges() == 0:
@@ -112,13 +212,14 @@ def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
             if subgraph.has_edge(u, v):
                 # If an edge already exists between u and v, retrieve its original weight.
                 # Since it's a MultiGraph, there might be multiple edges; take the first one.
-                original_weight = list(subgraph.get_edge_data(u, v).values())[0]['weight']
+                original_weight = next(iter(subgraph.get_edge_data(u, v).values()))['weight']
             else:
-                # If no direct edge exists, calculate the shortest path distance between u and v.
-                original_weight = nx.shortest_path_length(subgraph, source=u, target=v, weight='weight')
+                # If no direct edge exists, use the shortest path distance between u and v.
+                original_weight = odd_distances[u][v]
             # Add an edge between u and v with the original weight.
             # In a MultiGraph, this allows multiple edges between the same pair of nodes.
             subgraph.add_edge(u, v, weight=original_weight)
+            added_edges.append((u, v, original_weight))
 
         # After adding the necessary edges, the graph should now be Eulerian.
         try:
@@ -147,4 +248,7 @@ def calculate_undirected_cpp_route(waypoints, subgraph: nx.MultiGraph, logger):
     # ---------------------------
     # The ordered_route now represents a path that traverses every edge at least once.
     # This is the solution to the Chinese Postman Problem for the given subgraph.
+    _cpp_route_cache[signature] = (tuple(ordered_route), tuple(added_edges))
+    if len(_cpp_route_cache) > CPP_ROUTE_CACHE_SIZE:
+        _cpp_route_cache.popitem(last=False)
     return ordered_route
@@ -0,0 +1,142 @@
+# serialization.py
+
+"""
+JSON encoding helpers shared by the master and slave nodes.
+
+Every variable payload exchanged over `std_msgs/String` topics (navigation status,
+navigation graph, waypoint commands, ...) goes through `dumps`/`loads`. The fastest
+available backend is picked at import time: `orjson` if installed, then `ujson`, and
+finally the standard `json` module. Both third-party backends are implemented in native
+code and considerably faster than the standard library.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed packages
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the installed packages
+    ujson = None
+
+# Separators used by the standard-library encoder: no padding whitespace, so the payloads
+# are as compact as orjson's output (fewer bytes on the wire and to parse on the other side).
+COMPACT_SEPARATORS = (',', ':')
+
+# Exception raised by `loads` on malformed input. orjson.JSONDecodeError is a subclass of
+# json.JSONDecodeError, whereas ujson raises its own ValueError subclass: callers should
+# catch `serialization.JSONDecodeError` so that they work with any backend.
+if orjson is None and ujson is not None:
+    JSONDecodeError = ujson.JSONDecodeError
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def dumps(obj) -> str:
+        """
+        Serializes `obj` to a JSON string using orjson.
+
+        Parameters:
+        - obj: A JSON-serializable Python object.
+
+        Returns:
+        - str: The JSON document, ready to be assigned to `String.data`.
+        """
+        return orjson.dumps(obj).decode()
+
+    def loads(data):
+        """
+        Deserializes a JSON document (str or bytes) using orjson.
+
+        Parameters:
+        - data (str | bytes): The JSON document to parse.
+
+        Returns:
+        - The decoded Python object.
+        """
+        return orjson.loads(data)
+elif ujson is not None:
+    def dumps(obj) -> str:
+        """
+        Serializes `obj` to a compact JSON string using ujson.
+
+        Parameters:
+        - obj: A JSON-serializable Python object.
+
+        Returns:
+        - str: The JSON document, ready to be assigned to `String.data`.
+        """
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def loads(data):
+        """
+        Deserializes a JSON document (str or bytes) using ujson.
+
+        Parameters:
+        - data (str | bytes): The JSON document to parse.
+
+        Returns:
+        - The decoded Python object.
+        """
+        return ujson.loads(data)
+else:
+    def dumps(obj) -> str:
+        """
+        Serializes `obj` to a compact JSON string using the standard library.
+
+        Parameters:
+        - obj: A JSON-serializable Python object.
+
+        Returns:
+        - str: The JSON document, ready to be assigned to `String.data`.
+        """
+        return json.dumps(obj, separators=COMPACT_SEPARATORS)
+
+    def loads(data):
+        """
+        Deserializes a JSON document (str or bytes) using the standard library.
+
+        Parameters:
+        - data (str | bytes): The JSON document to parse.
+
+        Returns:
+        - The decoded Python object.
+        """
+        return json.loads(data)
+
+
+def parse_waypoint(data) -> dict:
+    """
+    Validates a decoded waypoint command in a single pass.
+
+    Waypoints are checked once, when they are received, so that a malformed command is
+    rejected up front instead of failing with a KeyError in the middle of a navigation
+    sequence. The returned dictionary only holds the fields the slaves use.
+
+    Parameters:
+    - data: The decoded payload, expected to be { "label": str, "x": float, "y": float }.
+
+    Returns:
+    - dict: The waypoint, with 'label' as str and 'x'/'y' as float.
+
+    Raises:
+    - ValueError: If the payload is not a mapping or a field is missing or has the wrong type.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Malformed waypoint {data!r}: expected an object")
+    try:
+        label = data['label']
+        x = data['x']
+        y = data['y']
+    except KeyError as e:
+        raise ValueError(f"Malformed waypoint {data!r}: missing {e}") from None
+    if not isinstance(label, str):
+        raise ValueError(f"Malformed waypoint {data!r}: 'label' must be a string")
+    # bool is an int subclass, but never a valid coordinate
+    if isinstance(x, bool) or isinstance(y, bool) or not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+        raise ValueError(f"Malformed waypoint {data!r}: 'x' and 'y' must be numbers")
+    return {'label': label, 'x': float(x), 'y': float(y)}
@@ -35,7 +35,8 @@ class SlaveState:
         
         current_waypoint_index (int): 
             The index of the next waypoint in `assigned_waypoints` that the slave is scheduled to navigate to.
-            This index increments as the slave progresses through its assigned waypoints.
+            This index increments as the slave progresses through its assigned waypoints, wrapping back
+            to 0 at the end of the route.
         
         current_edge (tuple or None): 
             A tuple representing the current edge (path between two nodes) that the slave is traversing.
@@ -59,6 +60,21 @@ class SlaveState:
             This is particularly useful during the initial assignment phase to trigger any necessary setup 
             or synchronization actions once the first waypoint is in place.
     """
+
+    # The master keeps one instance per slave and touches these attributes on every status
+    # update: fixed slots avoid a per-instance __dict__ and make attribute access cheaper.
+    __slots__ = (
+        'slave_ns',
+        'publisher',
+        'current_node',
+        'assigned_waypoints',
+        'current_waypoint_index',
+        'current_edge',
+        'waiting',
+        'ready',
+        'last_seen_time',
+        'has_first_waypoint_assigned',
+    )
     
     def __init__(self, slave_ns, publisher):
         """
@@ -128,7 +144,8 @@ class SlaveState:
         """
         The index of the next waypoint in `assigned_waypoints` that the slave is scheduled to navigate to.
         
-        This index increments as the slave progresses through its assigned waypoints.
+        This index increments as the slave progresses through its assigned waypoints, wrapping back
+        to 0 at the end of the route.
         """
         
         self.current_edge = None
@@ -1,9 +1,11 @@
 # waypoint_manager.py
 
-import json
+from rclpy.serialization import serialize_message
 from std_msgs.msg import String
 import networkx as nx
 
+from . import serialization
+from .graph_utils import make_edge_key
 from .path_calculation import calculate_undirected_cpp_route
 from .slave_state import SlaveState
 
@@ -26,6 +28,15 @@ class WaypointManager:
             A set that keeps track of nodes that have already been assigned to slaves to prevent
             duplicate assignments. (Note: In the current implementation, this set is initialized
             but not utilized. It can be leveraged in future enhancements for more granular control.)
+
+        assignments_publisher (rclpy.publisher.Publisher):
+            Publisher on the shared `/navigation_assignments` topic, used to send the first
+            waypoint of every slave in a single message when offsets are (re)distributed.
+
+        waypoint_msgs (dict):
+            Maps a node label to its ready-to-publish, CDR-serialized `navigation_commands`
+            message. Since the CPP route is cyclic, every waypoint is sent many times, so each
+            payload is encoded only once and then reused.
     """
     
     def __init__(self, node):
@@ -39,6 +50,31 @@ class WaypointManager:
         """
         self.node = node  # Reference to the MasterNavigationNode
         self.assigned_nodes = set()  # Tracks nodes that have been assigned to slaves to prevent duplication
+        self.assignments_publisher = self.node.create_publisher(
+            String, '/navigation_assignments', self.node.qos_profile
+        )
+        self.waypoint_msgs = {}  # Cache of encoded waypoint command messages, keyed by node label
+
+    def get_waypoint_msg(self, label):
+        """
+        Returns the serialized `navigation_commands` message for the given node, encoding it on first use.
+
+        Parameters:
+            label (str):
+                The label of the node in the full navigation graph.
+
+        Returns:
+            bytes: The serialized `String` carrying the JSON-encoded waypoint ('label', 'x', 'y'),
+                   which can be passed directly to `Publisher.publish`.
+        """
+        msg = self.waypoint_msgs.get(label)
+        if msg is None:
+            data = self.node.full_graph.nodes[label]
+            msg = String()
+            msg.data = serialization.dumps({'label': label, 'x': data['x'], 'y': data['y']})
+            msg = serialize_message(msg)
+            self.waypoint_msgs[label] = msg
+        return msg
     
     # ===================================================
     # Assigning Offsets Along the Global CPP Route
@@ -56,7 +92,8 @@ class WaypointManager:
           1. Determines the number of active slaves and the total number of waypoints.
           2. Calculates an offset for each slave to distribute them evenly along the route.
           3. Assigns the entire global CPP route to each slave, starting from their respective offsets.
-          4. Publishes the first waypoint to each slave without checking edge occupancy.
+          4. Publishes the first waypoint of every slave, without checking edge occupancy, in a
+             single message on `/navigation_assignments` (each slave picks its own entry).
         """
 
         # Check if a global CPP route exists
@@ -72,24 +109,41 @@ class WaypointManager:
 
         route_length = len(self.node.global_cpp_route)
 
+        # The graph may have been reloaded since the last distribution: drop stale payloads
+        self.waypoint_msgs.clear()
+
+        # Every slave follows the same route (only read, never modified): a single snapshot of
+        # the global route is shared instead of copying it once per slave
+        route = self.node.global_cpp_route.copy()
+
         # Calculate the offset index for each slave to distribute them evenly along the route
+        assignments = {}
         for i, slave in enumerate(active_slaves):
             offset_index = int(round(i * (route_length / num_slaves))) % route_length
-            slave.assigned_waypoints = self.node.global_cpp_route.copy()
+            slave.assigned_waypoints = route
             slave.current_waypoint_index = offset_index
             # Assign only the first waypoint without checking edge occupancy
-            self.assign_first_waypoint_to_slave(slave)
+            self.assign_first_waypoint_to_slave(slave, assignments)
+
+        # Send all the first waypoints at once instead of one message per slave
+        if assignments:
+            msg = String()
+            msg.data = serialization.dumps(assignments)
+            self.assignments_publisher.publish(msg)
 
         self.node.partitioning_done = True
         # self.node.get_logger().info("==== assign_offsets_along_route() END ====")
     
-    def assign_first_waypoint_to_slave(self, slave):
+    def assign_first_waypoint_to_slave(self, slave, assignments):
         """
         Assigns the first waypoint to a slave without checking edge occupancy.
         
         Parameters:
             slave (SlaveState):
                 The `SlaveState` instance representing the slave to assign the first waypoint to.
+            assignments (dict):
+                Batch of first waypoints being built by the caller, keyed by slave namespace.
+                The waypoint ('label', 'x', 'y') of this slave is added to it.
         """
         idx = slave.current_waypoint_index
         route = slave.assigned_waypoints
@@ -99,14 +153,7 @@ class WaypointManager:
 
         next_label = route[idx]
         data = self.node.full_graph.nodes[next_label]
-        waypoint_msg = {
-            'label': next_label,
-            'x': data['x'],
-            'y': data['y']
-        }
-        msg = String()
-        msg.data = json.dumps(waypoint_msg)
-        slave.publisher.publish(msg)
+        assignments[slave.slave_ns] = {'label': next_label, 'x': data['x'], 'y': data['y']}
         self.node.get_logger().info(
             f"Assigned first waypoint '{next_label}' to slave '{slave.slave_ns}' (offset_idx={idx})."
         )
@@ -136,28 +183,28 @@ class WaypointManager:
             self.node.get_logger().warn(f"No waypoints assigned to slave {slave_ns}.")
             return
 
-        # If the slave has traversed all assigned waypoints, optionally restart the route
-        if slave.current_waypoint_index >= len(slave.assigned_waypoints):
-            self.node.get_logger().info(f"All assigned waypoints for {slave_ns} have been traversed. Restarting route.")
-            slave.current_waypoint_index = 0
+        num_waypoints = len(slave.assigned_waypoints)
 
-        # Determine the next waypoint to assign
-        next_node = slave.assigned_waypoints[slave.current_waypoint_index]
         from_node = slave.current_node
 
-        # Prevent assigning a waypoint that is the same as the current node (self-edge)
-        if next_node == from_node:
+        # Determine the next waypoint to assign, skipping waypoints that are the same as the
+        # current node (self-edges). The scan is bounded by the route length, so a route made
+        # only of the current node cannot loop forever.
+        for _ in range(num_waypoints):
+            next_node = slave.assigned_waypoints[slave.current_waypoint_index]
+            if next_node != from_node:
+                break
             self.node.get_logger().warn(
                 f"Slave '{slave_ns}' next_node ({next_node}) is the same as current_node; skipping to next waypoint."
             )
             # Increment the waypoint index to skip the current (invalid) waypoint
-            slave.current_waypoint_index = (slave.current_waypoint_index + 1) % len(slave.assigned_waypoints)
-            # Recursively call assign_next_waypoint to assign the next valid waypoint
-            self.assign_next_waypoint(slave_ns)
+            slave.current_waypoint_index = (slave.current_waypoint_index + 1) % num_waypoints
+        else:
+            self.node.get_logger().warn(f"No waypoint different from the current node for slave {slave_ns}.")
             return
 
         # Create an ordered tuple for the edge to maintain consistency
-        edge_key = tuple(sorted([from_node, next_node]))
+        edge_key = make_edge_key(from_node, next_node)
 
         # Check if the desired edge is already occupied by another slave
         if edge_key in self.node.occupied_edges:
@@ -182,25 +229,37 @@ class WaypointManager:
             # Mark the slave as not waiting
             slave.waiting = False
 
-        # Create and publish the waypoint message to the slave
-        data = self.node.full_graph.nodes[next_node]
-        waypoint_msg = {
-            'label': next_node,
-            'x': data['x'],
-            'y': data['y'],
-        }
-        msg = String()
-        msg.data = json.dumps(waypoint_msg)
-        slave.publisher.publish(msg)
-
-        # Log the successful assignment of the next waypoint
-        self.node.get_logger().info(
-            f"Assigned next waypoint '{next_node}' to slave '{slave_ns}'. "
-            f"Edge {edge_key} is now occupied by '{slave_ns}'."
-        )
+        # Publish the (cached) waypoint message to the slave
+        slave.publisher.publish(self.get_waypoint_msg(next_node))
+
+        # Log the successful assignment of the next waypoint (once per waypoint: debug only)
+        if self.node.debug_logging:
+            self.node.get_logger().debug(
+                f"Assigned next waypoint '{next_node}' to slave '{slave_ns}'. "
+                f"Edge {edge_key} is now occupied by '{slave_ns}'."
+            )
+
+        # Advance to the next waypoint for the next assignment
+        self.advance_waypoint_index(slave)
 
-        # Increment the waypoint index for the next assignment
+    def advance_waypoint_index(self, slave):
+        """
+        Moves the slave to the next waypoint of its route, restarting from the beginning
+        once the whole route has been traversed.
+
+        The index is wrapped here, when it is advanced, so `current_waypoint_index` is always
+        a valid position in `assigned_waypoints` and readers can index the route directly.
+
+        Parameters:
+            slave (SlaveState):
+                The `SlaveState` instance whose waypoint index is advanced.
+        """
         slave.current_waypoint_index += 1
+        if slave.current_waypoint_index >= len(slave.assigned_waypoints):
+            self.node.get_logger().info(
+                f"All assigned waypoints for {slave.slave_ns} have been traversed. Restarting route."
+            )
+            slave.current_waypoint_index = 0
 
     # ===================================================
     # Assigning Waypoints to Waiting Slaves
@@ -214,13 +273,12 @@ class WaypointManager:
         for a waypoint assignment due to edge occupancy conflicts. For each waiting slave, it attempts
         to assign the next waypoint if the required edge becomes available.
         """
-        # Iterate through all slaves in alphabetical order based on their namespaces
-        for slave_ns in sorted(self.node.slaves.keys()):
+        # Iterate through the waiting slaves in alphabetical order based on their namespaces.
+        # Only those are sorted: on most ticks nobody is waiting and nothing is sorted at all.
+        waiting_slaves = sorted(slave_ns for slave_ns, slave in self.node.slaves.items() if slave.waiting)
+        for slave_ns in waiting_slaves:
             # Retrieve the SlaveState instance for the current slave
             slave = self.node.slaves[slave_ns]
-            # Skip slaves that are not waiting
-            if not slave.waiting:
-                continue
 
             # Check if the slave has any waypoints assigned
             if not slave.assigned_waypoints:
@@ -231,7 +289,7 @@ class WaypointManager:
             next_node = slave.assigned_waypoints[slave.current_waypoint_index]
             from_node = slave.current_node
             # Create an ordered tuple for the edge
-            edge_key = tuple(sorted([from_node, next_node]))
+            edge_key = make_edge_key(from_node, next_node)
 
             # Check if the desired edge has been freed (no longer occupied)
             if edge_key not in self.node.occupied_edges:
@@ -244,27 +302,20 @@ class WaypointManager:
                 # Mark the slave as not waiting
                 slave.waiting = False
 
-                # Create and publish the waypoint message to the slave
-                data = self.node.full_graph.nodes[next_node]
-                waypoint_msg = {
-                    'label': next_node,
-                    'x': data['x'],
-                    'y': data['y'],
-                }
-                msg = String()
-                msg.data = json.dumps(waypoint_msg)
-                slave.publisher.publish(msg)
+                # Publish the (cached) waypoint message to the slave
+                slave.publisher.publish(self.get_waypoint_msg(next_node))
 
                 # Log the successful assignment of the waiting waypoint
-                self.node.get_logger().info(
-                    f"Assigned waiting waypoint '{next_node}' to slave '{slave_ns}'. "
-                    f"Edge {edge_key} is now occupied by '{slave_ns}'."
-                )
+                if self.node.debug_logging:
+                    self.node.get_logger().debug(
+                        f"Assigned waiting waypoint '{next_node}' to slave '{slave_ns}'. "
+                        f"Edge {edge_key} is now occupied by '{slave_ns}'."
+                    )
 
                 # Update the slave's current node to the newly assigned waypoint
                 slave.current_node = next_node
-                # Increment the waypoint index for the next assignment
-                slave.current_waypoint_index += 1
+                # Advance to the next waypoint for the next assignment
+                self.advance_waypoint_index(slave)
             else:
                 # If the edge is still occupied, log a warning and leave the slave in the waiting state
                 self.node.get_logger().warn(
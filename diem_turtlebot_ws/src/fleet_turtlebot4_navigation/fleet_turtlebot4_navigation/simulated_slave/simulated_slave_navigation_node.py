@@ -3,20 +3,26 @@
 import rclpy
 from rclpy.node import Node
 from std_msgs.msg import String
-import json
+import sys
 import time
 import math
 import random
 from threading import Lock, Event
 
 # Required imports for QoS profile configuration
-from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
+from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy, HistoryPolicy
+from rclpy.serialization import serialize_message
+from rclpy.qos_event import SubscriptionEventCallbacks
+from rclpy.duration import Duration
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 
 # Master Tools (only import these if you need the master logic):
 from fleet_turtlebot4_navigation.master.master_callbacks import MasterCallbacks
 from fleet_turtlebot4_navigation.master.heartbeat_manager import HeartbeatManager
 from fleet_turtlebot4_navigation.master.waypoint_manager import WaypointManager
 from fleet_turtlebot4_navigation.master.graph_utils import load_full_graph_from_data
+from fleet_turtlebot4_navigation.master import serialization
 
 class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
     """
@@ -29,6 +35,9 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
       - Can become Master using the Bully algorithm (election-based).
     """
 
+    # Simulated travel speed (units/sec), used to compute the time spent on each edge
+    SIMULATED_SPEED = 1.31
+
     def __init__(self, robot_namespace='robot1', graph_path='/path/to/default_graph.json'):
         """
         Initialize the SimulatedSlaveNavigationNode in SLAVE mode.
@@ -37,6 +46,11 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
             robot_namespace (str): The namespace of this robot. Default 'robot1'.
             graph_path (str): The path to the navigation graph in JSON format.
         """
+        # The namespace is published verbatim as this slave's identity and the Master does not
+        # strip it, so a namespace with whitespace is rejected here, once, at start-up
+        if any(c.isspace() for c in robot_namespace):
+            raise ValueError(f"Invalid robot namespace {robot_namespace!r}: whitespace is not allowed")
+
         # Call the Node constructor, naming the node 'simulated_slave_navigation_node'
         # and placing it under the specified namespace
         super().__init__('simulated_slave_navigation_node', namespace=robot_namespace)
@@ -44,22 +58,49 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         # Initialize MasterCallbacks (if you want to inherit the master's logic)
         MasterCallbacks.__init__(self)
         
-        # Store the robot namespace
-        self.robot_namespace = robot_namespace
+        # Store the robot namespace (interned, like the Master's slave keys)
+        self.robot_namespace = sys.intern(robot_namespace)
         
         # Define and initialize a QoSProfile with specific settings
         self.qos_profile = QoSProfile(depth=10)
         self.qos_profile.reliability = ReliabilityPolicy.RELIABLE
         self.qos_profile.durability = DurabilityPolicy.VOLATILE
+
+        # Heartbeats only matter for their freshness: keep just the latest one, best effort,
+        # so stale beats never pile up behind a busy callback
+        self.heartbeat_qos_profile = QoSProfile(depth=1)
+        self.heartbeat_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.heartbeat_qos_profile.durability = DurabilityPolicy.VOLATILE
+
+        # Master heartbeats (1 Hz) additionally carry a 2 s deadline, offered by the Master and
+        # requested here, so a missing heartbeat is reported by a QoS event instead of polling
+        self.master_heartbeat_qos_profile = QoSProfile(depth=1)
+        self.master_heartbeat_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.master_heartbeat_qos_profile.durability = DurabilityPolicy.VOLATILE
+        self.master_heartbeat_qos_profile.deadline = Duration(seconds=2.0)
+
+        # Registrations are resent every second, so best effort is enough; the topic is shared
+        # by all slaves, hence a small queue rather than a single slot
+        self.registration_qos_profile = QoSProfile(depth=10)
+        self.registration_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.registration_qos_profile.durability = DurabilityPolicy.VOLATILE
+
+        # The navigation graph is published once by the Master and kept by DDS (latest only),
+        # so a slave that subscribes late still receives it without any republishing
+        self.graph_qos_profile = QoSProfile(depth=1)
+        self.graph_qos_profile.history = HistoryPolicy.KEEP_LAST
+        self.graph_qos_profile.reliability = ReliabilityPolicy.RELIABLE
+        self.graph_qos_profile.durability = DurabilityPolicy.TRANSIENT_LOCAL
         
         # Store the graph path used when the node becomes the Master
         self.graph_path = graph_path
         
         # Main flags and state variables
         self.is_master = False
-        self.master_alive = True
-        self.last_master_heartbeat = time.time()
+        self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
         self.heartbeat_timeout = 1000.0
+        # Set by the first Master heartbeat: from then on, loss is detected by the deadline event
+        self.master_heartbeat_seen = False
         
         # Declare a parameter 'timeout' (default: 5.0) for controlling slave inactivity
         self.declare_parameter('timeout', 5.0)
@@ -72,10 +113,15 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         # Navigation state
         self.graph_received = False
         self.navigation_graph = None
+        # Global graph, loaded from 'graph_path' only if this node becomes Master
+        self.full_graph = None
         self.current_node = None  # Start with no known position
         self.assigned_waypoints = []
         self.is_navigating = False
         self.navigation_lock = Lock()
+        # One-shot timer simulating the travel in progress, and its (label, time, edge)
+        self.navigation_timer = None
+        self.pending_navigation = None
         
         # Data structures typical for the Master
         self.slaves = {}
@@ -91,28 +137,57 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         
         # ------------------------- Publishers (SLAVE side) -------------------------
         # Publish the slave registration info to notify the Master
-        self.slave_registration_publisher = self.create_publisher(String, '/slave_registration', self.qos_profile)
+        self.slave_registration_publisher = self.create_publisher(String, '/slave_registration', self.registration_qos_profile)
         # Publish heartbeat messages from the slave to the Master
-        self.heartbeat_publisher = self.create_publisher(String, '/slave_heartbeat', self.qos_profile)
+        self.heartbeat_publisher = self.create_publisher(String, '/slave_heartbeat', self.heartbeat_qos_profile)
+        # Registration and heartbeat payloads are constant (the namespace): serialize them once
+        # and publish the raw bytes on every tick, skipping the Python-to-C message conversion
+        namespace_msg = String()
+        namespace_msg.data = self.robot_namespace
+        self.registration_msg = serialize_message(namespace_msg)
+        self.heartbeat_msg = self.registration_msg
         # Publish the current navigation status
         self.status_publisher = self.create_publisher(String, '/navigation_status', self.qos_profile)
         
         # Publish election and coordinator messages (for the Bully algorithm)
         self.election_publisher = self.create_publisher(String, '/election', self.qos_profile)
         self.coordinator_publisher = self.create_publisher(String, '/coordinator', self.qos_profile)
-        
+        # Election, OK and coordinator payloads only carry our namespace: encode them once
+        self.election_msg = String()
+        self.election_msg.data = serialization.dumps({"type": "ELECTION", "sender": self.robot_namespace})
+        self.ok_msg = String()
+        self.ok_msg.data = serialization.dumps({"type": "OK", "sender": self.robot_namespace})
+        self.coordinator_msg = String()
+        self.coordinator_msg.data = serialization.dumps({"type": "COORDINATOR", "sender": self.robot_namespace})
+        
+        # Callback groups: navigation commands (and the simulated travel timer) get their own
+        # group; heartbeats and the tick get another one, so that they keep being served by the
+        # MultiThreadedExecutor (see run()) while other callbacks are busy (e.g. loading the
+        # graph or becoming Master), instead of the Master being declared lost. Everything
+        # else stays in the default group.
+        self.heartbeat_callback_group = MutuallyExclusiveCallbackGroup()
+        self.navigation_callback_group = MutuallyExclusiveCallbackGroup()
+
         # ------------------------- Subscribers (SLAVE side) ------------------------
         # Listen for commands from the Master (waypoints)
         self.navigation_commands_subscriber = self.create_subscription(
-            String, 'navigation_commands', self.slave_navigation_commands_callback, self.qos_profile
+            String, 'navigation_commands', self.slave_navigation_commands_callback, self.qos_profile,
+            callback_group=self.navigation_callback_group
+        )
+        # Listen for the batched first-waypoint assignments broadcast to all slaves
+        self.navigation_assignments_subscriber = self.create_subscription(
+            String, '/navigation_assignments', self.navigation_assignments_callback, self.qos_profile,
+            callback_group=self.navigation_callback_group
         )
         # Listen for heartbeats from the Master to detect Master failure
         self.master_heartbeat_subscriber = self.create_subscription(
-            String, '/master_heartbeat', self.master_heartbeat_callback, self.qos_profile
+            String, '/master_heartbeat', self.master_heartbeat_callback, self.master_heartbeat_qos_profile,
+            callback_group=self.heartbeat_callback_group,
+            event_callbacks=SubscriptionEventCallbacks(deadline=self.master_heartbeat_deadline_missed)
         )
         # Listen for the global navigation graph broadcast by the Master
         self.graph_subscriber = self.create_subscription(
-            String, '/navigation_graph', self.slave_navigation_graph_callback, self.qos_profile
+            String, '/navigation_graph', self.slave_navigation_graph_callback, self.graph_qos_profile
         )
         # Listen for election messages
         self.election_subscriber = self.create_subscription(
@@ -124,16 +199,18 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         )
         
         # ------------------------- Timers (SLAVE side) ----------------------------
-        # Timer that periodically publishes this slave's registration
-        self.registration_timer = self.create_timer(1.0, self.publish_registration)
-        # Timer that periodically publishes heartbeat messages to the Master
-        self.heartbeat_timer = self.create_timer(1.0, self.publish_heartbeat)
-        # Timer that checks periodically if the Master is alive
-        self.check_master_timer = self.create_timer(1.0, self.check_master_alive)
+        # A single 1 Hz tick publishes the registration and the heartbeat and checks
+        # whether the Master is alive, instead of three separate timers waking the executor.
+        self.publishing_heartbeat = True
+        self.tick_timer = self.create_timer(
+            1.0, self.tick_callback, callback_group=self.heartbeat_callback_group
+        )
         
         # Flags and threading events for election handling
         self.election_in_progress = False
         self.election_event = Event()
+        # Serializes the election -> Master transition across the executor threads
+        self.election_lock = Lock()
         
         # Random startup delay to reduce simultaneous election conflicts
         startup_delay = random.uniform(0, 2)
@@ -151,58 +228,81 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         self.first_wp_notification_sent = False
         # Publisher for notifying that the first waypoint was reached
         self.first_wp_reached_pub = self.create_publisher(String, '/first_waypoint_reached', self.qos_profile)
+        self.first_wp_reached_msg = String()
+        self.first_wp_reached_msg.data = serialization.dumps({"robot_namespace": self.robot_namespace})
 
     # =========================================================================
     # SLAVE methods: publishing and callbacks
     # =========================================================================
     
+    def tick_callback(self):
+        """
+        Periodic 1 Hz tick that runs all the SLAVE-side periodic tasks:
+          - publishes the registration,
+          - publishes the heartbeat (until the node becomes Master),
+          - checks whether the Master is alive, until its first heartbeat arrives
+            (afterwards the deadline QoS event takes over).
+        """
+        self.publish_registration()
+        if self.publishing_heartbeat:
+            self.publish_heartbeat()
+        if not self.master_heartbeat_seen:
+            self.check_master_alive()
+
     def publish_registration(self):
         """
         Publishes the robot's namespace to the '/slave_registration' topic.
         Helps the Master discover or confirm this slave's existence.
         """
-        msg = String()
-        msg.data = self.robot_namespace
-        self.slave_registration_publisher.publish(msg)
-        self.get_logger().debug(f"[{self.robot_namespace}] Published slave registration.")
+        self.slave_registration_publisher.publish(self.registration_msg)
     
     def publish_heartbeat(self):
         """
         Publishes a heartbeat signal indicating this slave is alive.
         Helps the Master keep track of active slaves.
         """
-        hb = String()
-        hb.data = self.robot_namespace
-        self.heartbeat_publisher.publish(hb)
-        self.get_logger().debug(f"[{self.robot_namespace}] Published slave heartbeat.")
+        self.heartbeat_publisher.publish(self.heartbeat_msg)
     
     def master_heartbeat_callback(self, msg):
         """
         Callback triggered whenever a Master heartbeat is received.
-        Resets the 'master_alive' flag, preventing election from starting.
+        Records the heartbeat time, preventing election from starting.
         """
-        self.master_alive = True
-        self.last_master_heartbeat = time.time()
-        self.get_logger().debug(f"[{self.robot_namespace}] Received Master heartbeat.")
+        self.master_heartbeat_seen = True
+        self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Received Master heartbeat.")
+
+    def master_heartbeat_deadline_missed(self, event):
+        """
+        QoS event callback fired when no Master heartbeat arrived within the deadline.
+        DDS keeps firing it once per missed period, so the timeout is checked only while
+        heartbeats are actually missing; if it has expired, starts an election.
+        """
+        # If already Master, no need to check
+        if self.is_master:
+            return
+        
+        if self.get_clock().now().nanoseconds / 1e9 - self.last_master_heartbeat > self.heartbeat_timeout:
+            self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating Election!")
+            self.elect_new_master()
     
     def check_master_alive(self):
         """
         Timer-based check to confirm whether the Master is still alive.
         If the Master has not sent any heartbeat for too long, starts an election.
+        Only used until the first Master heartbeat is received: the deadline QoS event
+        cannot fire for a Master that never published.
         """
         # If already Master, no need to check
         if self.is_master:
             return
         
-        # The first time we fail to see a heartbeat, set master_alive to False
-        if self.master_alive:
-            self.master_alive = False
-        else:
-            # If no heartbeat for over 'heartbeat_timeout' seconds, do election
-            now = time.time()
-            if now - self.last_master_heartbeat > self.heartbeat_timeout:
-                self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating Election!")
-                self.elect_new_master()
+        # If no heartbeat for over 'heartbeat_timeout' seconds, do election
+        now = self.get_clock().now().nanoseconds / 1e9
+        if now - self.last_master_heartbeat > self.heartbeat_timeout:
+            self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating Election!")
+            self.elect_new_master()
 
     # =========================================================================
     # Bully Election Algorithm
@@ -213,33 +313,33 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         Initiates the Bully election algorithm.
         This node tries to become Master if it is the 'highest' node or if no higher nodes respond.
         """
-        # If already running an election, skip
-        if self.election_in_progress:
-            self.get_logger().info(f"[{self.robot_namespace}] Election already in progress.")
-            return
-        
-        self.election_in_progress = True
-        self.election_event.clear()
+        # The tick, the Master heartbeat deadline event and election_callback run on different
+        # executor threads: the election is claimed under 'election_lock', so only one runs at a time
+        with self.election_lock:
+            if self.is_master:
+                return
+            if self.election_in_progress:
+                self.get_logger().info(f"[{self.robot_namespace}] Election already in progress.")
+                return
+            self.election_in_progress = True
+            self.election_event.clear()
         
-        # Identify any active slaves with a 'higher' namespace (greater string comparison)
+        # Check whether any active slave has a 'higher' namespace (greater string comparison);
+        # stops at the first one found
         with self.active_slaves_lock:
-            higher_nodes = [node for node in self.active_slaves if node > self.robot_namespace]
+            has_higher_nodes = any(node > self.robot_namespace for node in self.active_slaves)
         
         # If no higher nodes exist, become Master immediately
-        if not higher_nodes:
+        if not has_higher_nodes:
             self.get_logger().info(f"[{self.robot_namespace}] No higher nodes found. Becoming MASTER!")
-            self.become_master()
-            self.election_in_progress = False
-            self.election_event.set()
+            self.promote_to_master()
             return
         
-        # Broadcast election message to higher nodes
-        for node in higher_nodes:
-            election_msg = {"type": "ELECTION", "sender": self.robot_namespace}
-            msg = String()
-            msg.data = json.dumps(election_msg)
-            self.election_publisher.publish(msg)
-            self.get_logger().debug(f"[{self.robot_namespace}] Sent ELECTION to '{node}'.")
+        # Broadcast the election message: '/election' is shared by all nodes, so a single
+        # message reaches every higher node
+        self.election_publisher.publish(self.election_msg)
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Sent ELECTION to higher nodes.")
         
         # Wait for responses (OK messages)
         wait_time = 5
@@ -253,8 +353,17 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         
         # If no OK messages received, become Master
         self.get_logger().info(f"[{self.robot_namespace}] No OK received => Becoming MASTER!")
-        self.become_master()
-        self.election_in_progress = False
+        self.promote_to_master()
+
+    def promote_to_master(self):
+        """
+        Ends an election won by this node: becomes Master (at most once) and releases the election.
+        The transition holds 'election_lock', so that concurrent elections cannot run it twice.
+        """
+        with self.election_lock:
+            if not self.is_master:
+                self.become_master()
+            self.election_in_progress = False
         self.election_event.set()
 
     def election_callback(self, msg):
@@ -262,20 +371,17 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         Callback for handling election messages from other nodes.
         """
         try:
-            election_msg = json.loads(msg.data)
+            election_msg = serialization.loads(msg.data)
             # Ignore messages that aren't of type 'ELECTION'
             if election_msg.get("type") != "ELECTION":
                 return
             sender = election_msg.get("sender")
             # If the sender is 'lower' than self.robot_namespace, respond with 'OK' and start another election
             if sender and sender < self.robot_namespace:
-                ok_msg = {"type": "OK", "sender": self.robot_namespace}
-                response = String()
-                response.data = json.dumps(ok_msg)
-                self.election_publisher.publish(response)
+                self.election_publisher.publish(self.ok_msg)
                 self.get_logger().info(f"[{self.robot_namespace}] Received ELECTION from '{sender}', sent OK.")
                 self.elect_new_master()
-        except json.JSONDecodeError as e:
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding ELECTION message: {e}")
 
     def coordinator_callback(self, msg):
@@ -284,18 +390,17 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         This means another node has won the election.
         """
         try:
-            coord_msg = json.loads(msg.data)
+            coord_msg = serialization.loads(msg.data)
             if coord_msg.get("type") != "COORDINATOR":
                 return
             sender = coord_msg.get("sender")
             if sender:
                 self.get_logger().info(f"[{self.robot_namespace}] COORDINATOR from '{sender}'. That is the new Master.")
                 self.is_master = False
-                self.master_alive = True
-                self.last_master_heartbeat = time.time()
+                self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
                 self.election_in_progress = False
                 self.election_event.set()
-        except json.JSONDecodeError as e:
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding COORDINATOR message: {e}")
 
     # =========================================================================
@@ -312,11 +417,12 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
             return
         
         if self.graph_received:
-            self.get_logger().debug(f"[{self.robot_namespace}] Graph already received, ignoring.")
+            if self.debug_logging:
+                self.get_logger().debug(f"[{self.robot_namespace}] Graph already received, ignoring.")
             return
         
         try:
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             # Load the graph structure from JSON data
             self.navigation_graph = load_full_graph_from_data(data)
             self.graph_received = True
@@ -331,11 +437,16 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
                 'traversed_edge': []
             }
             rmsg = String()
-            rmsg.data = json.dumps(ready_data)
+            rmsg.data = serialization.dumps(ready_data)
             self.status_publisher.publish(rmsg)
             self.get_logger().info(f"[{self.robot_namespace}] Graph received, published 'ready' status.")
             
-        except json.JSONDecodeError as e:
+            # Later publishes of the graph (e.g. by a newly elected Master) would be ignored:
+            # unsubscribe, so the whole graph string is no longer delivered and converted
+            self.destroy_subscription(self.graph_subscriber)
+            self.graph_subscriber = None
+            
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding graph as slave: {e}")
 
     # =========================================================================
@@ -353,11 +464,46 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         
         # Parse incoming waypoint data
         try:
-            waypoint_data = json.loads(msg.data)
-        except json.JSONDecodeError as e:
+            waypoint_data = serialization.parse_waypoint(serialization.loads(msg.data))
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding waypoint: {e}")
             return
+        except ValueError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Invalid waypoint: {e}")
+            return
+        
+        self.enqueue_waypoint(waypoint_data)
+
+    def navigation_assignments_callback(self, msg):
+        """
+        Callback for the batched assignments broadcast by the Master on '/navigation_assignments'.
+        The message maps each slave namespace to its waypoint: only our own entry is queued.
+        """
+        # If Master, ignore this
+        if self.is_master:
+            return
+        
+        try:
+            assignments = serialization.loads(msg.data)
+        except serialization.JSONDecodeError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Error decoding assignments: {e}")
+            return
         
+        waypoint_data = assignments.get(self.robot_namespace)
+        if waypoint_data is None:
+            return
+        try:
+            waypoint_data = serialization.parse_waypoint(waypoint_data)
+        except ValueError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Invalid waypoint: {e}")
+            return
+        self.enqueue_waypoint(waypoint_data)
+
+    def enqueue_waypoint(self, waypoint_data):
+        """
+        Appends a waypoint received from the Master to the queue and starts navigation
+        if not already navigating.
+        """
         # If no graph is available, we can't navigate
         if not self.graph_received or self.navigation_graph is None:
             self.get_logger().warn(f"[{self.robot_namespace}] No graph available => cannot navigate.")
@@ -367,24 +513,40 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         # Add the waypoint to the assigned queue, and if not navigating, start
         with self.navigation_lock:
             self.assigned_waypoints.append(waypoint_data)
-            self.get_logger().info(f"[{self.robot_namespace}] Received waypoint: {waypoint_data}")
-            if not self.is_navigating:
+            if self.debug_logging:
+                self.get_logger().debug(f"[{self.robot_namespace}] Received waypoint: {waypoint_data}")
+            start_navigation = not self.is_navigating
+            if start_navigation:
                 self.is_navigating = True
-                self.execute_waypoints_in_sequence()
+        if start_navigation:
+            self.execute_waypoints_in_sequence()
 
     def execute_waypoints_in_sequence(self):
         """
-        Continuously execute waypoints in FIFO order until the queue is empty.
-        """
-        while self.assigned_waypoints:
-            wpt = self.assigned_waypoints.pop(0)
-            self.simulate_navigation(wpt)
-        self.is_navigating = False
+        Execute queued waypoints in FIFO order until the queue is empty or a simulated
+        travel is in progress. In the latter case the travel timer resumes the sequence
+        through finish_simulated_navigation() once the travel time has elapsed.
+        """
+        while True:
+            with self.navigation_lock:
+                if not self.assigned_waypoints:
+                    self.is_navigating = False
+                    return
+                wpt = self.assigned_waypoints.pop(0)
+            if self.simulate_navigation(wpt):
+                return
 
     def simulate_navigation(self, waypoint):
         """
         Simulate the robot traveling from the current node to the waypoint.
         Publishes relevant status updates and handles the first waypoint behavior.
+
+        The travel time is simulated with a one-shot ROS timer instead of sleeping,
+        so the executor keeps processing heartbeats and other callbacks meanwhile.
+
+        Returns:
+            bool: True if a simulated travel was started (completion is asynchronous),
+                  False if the waypoint was handled immediately.
         """
         label = waypoint['label']
         x = waypoint['x']
@@ -396,32 +558,26 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
             self.publish_status("reached", "", 0.0, label, [label, label])
 
             # If we haven't notified about the first waypoint yet, do it now
-            if not self.first_wp_notification_sent:
-                notif = {"robot_namespace": self.robot_namespace}
-                msg_notif = String()
-                msg_notif.data = json.dumps(notif)
-                self.first_wp_reached_pub.publish(msg_notif)
-                self.first_wp_notification_sent = True
-            return
+            self.publish_first_waypoint_notification()
+            return False
             
         # If we are already at the target label, just log a message
         if self.current_node == label:
             self.get_logger().info(f"[{self.robot_namespace}] Already at '{label}'.")
-            return
+            return False
         
         # Check if current_node or destination are valid nodes in the graph
         if (self.current_node not in self.navigation_graph.nodes) or (label not in self.navigation_graph.nodes):
             err_msg = f"Current node='{self.current_node}' or destination='{label}' not in the graph"
             self.get_logger().error(f"[{self.robot_namespace}] {err_msg}")
             self.publish_status("error", err_msg, 0.0, label, [])
-            return
+            return False
 
         # Calculate distance and travel time
         cx = self.navigation_graph.nodes[self.current_node]['x']
         cy = self.navigation_graph.nodes[self.current_node]['y']
         dist = math.hypot(x - cx, y - cy)
-        speed = 1.31
-        ttime = dist / speed
+        ttime = dist / self.SIMULATED_SPEED
         
         # Publish 'traversing' status
         trav_edge = [self.current_node, label]
@@ -430,8 +586,24 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
             f"[{self.robot_namespace}] Navigating from '{self.current_node}' to '{label}' ~{ttime:.2f}s."
         )
         
-        # Simulate the travel time with a sleep
-        time.sleep(ttime)
+        # Simulate the travel time with a one-shot timer
+        self.pending_navigation = (label, ttime, trav_edge)
+        self.navigation_timer = self.create_timer(
+            ttime, self.finish_simulated_navigation, callback_group=self.navigation_callback_group
+        )
+        return True
+
+    def finish_simulated_navigation(self):
+        """
+        One-shot timer callback fired when the simulated travel time has elapsed.
+        Marks the destination as reached and continues with the queued waypoints.
+        """
+        # The timer is one-shot: dispose of it on the first expiration
+        self.destroy_timer(self.navigation_timer)
+        self.navigation_timer = None
+
+        label, ttime, trav_edge = self.pending_navigation
+        self.pending_navigation = None
         self.current_node = label
         
         # Publish 'reached' status
@@ -439,11 +611,16 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         self.publish_status("reached", "", ttime, label, trav_edge)
         
         # If it's truly the first "real" waypoint we reach, notify
+        self.publish_first_waypoint_notification()
+
+        self.execute_waypoints_in_sequence()
+
+    def publish_first_waypoint_notification(self):
+        """
+        Publishes the one-time '/first_waypoint_reached' notification, if not sent yet.
+        """
         if not self.first_wp_notification_sent:
-            notif = {"robot_namespace": self.robot_namespace}
-            msg_notif = String()
-            msg_notif.data = json.dumps(notif)
-            self.first_wp_reached_pub.publish(msg_notif)
+            self.first_wp_reached_pub.publish(self.first_wp_reached_msg)
             self.first_wp_notification_sent = True
 
     def publish_status(self, status, error_message, time_taken, current_waypoint, trav):
@@ -459,9 +636,10 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
             'traversed_edge': trav
         }
         s = String()
-        s.data = json.dumps(st)
+        s.data = serialization.dumps(st)
         self.status_publisher.publish(s)
-        self.get_logger().debug(f"[{self.robot_namespace}] Published status: {st}")
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Published status: {st}")
 
     # =========================================================================
     # Becoming MASTER
@@ -475,8 +653,8 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         self.is_master = True
         self.get_logger().info(f"[{self.robot_namespace}] => MASTER MODE activated")
         
-        # Start publishing Master heartbeats with the shared QoS profile
-        self.heartbeat_manager = HeartbeatManager(self, self.qos_profile)
+        # Start publishing Master heartbeats with the heartbeat QoS profile
+        self.heartbeat_manager = HeartbeatManager(self, self.master_heartbeat_qos_profile)
         self.heartbeat_manager.start_publishing()
         
         # Create a WaypointManager for Master tasks
@@ -487,36 +665,21 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         self.occupied_edges.clear()
         self.edge_occupants.clear()
         
-        # Subscribe to slave_registration and navigation_status as Master
-        self.slave_registration_subscriber = self.create_subscription(
-            String, '/slave_registration', self.slave_registration_callback, self.qos_profile
-        )
-        self.navigation_status_subscriber = self.create_subscription(
-            String, '/navigation_status', self.navigation_status_callback, self.qos_profile
-        )
-        
-        # If we have a valid graph path, try to load it
+        # If we have a valid graph path, try to load it. This is done before subscribing as
+        # Master: registrations are served on another executor thread and start the CPP route
+        # calculation, which reads 'full_graph'
         if self.graph_path:
             try:
-                with open(self.graph_path, 'r') as f:
-                    graph_data = json.load(f)
+                with open(self.graph_path, 'rb') as f:
+                    graph_data = serialization.loads(f.read())
                 # Convert JSON data into a usable graph structure
                 self.full_graph = load_full_graph_from_data(graph_data)
+                self.navigation_graph_msg = None
                 self.get_logger().info(f"[{self.robot_namespace}] (MASTER) Loaded navigation_graph from '{self.graph_path}'.")
-                
-                # Publish the navigation graph so that other slaves can receive it
-                self.publish_navigation_graph()
-                
-                # Compute the global CPP (Chinese Postman Problem) route
-                self.compute_global_cpp_route()
-                self.get_logger().info(f"Global CPP route computed: {self.global_cpp_route}")
-                
-                # Assign waypoints to slaves based on the new route
-                self.waypoint_manager.repartition_and_assign_waypoints()
             except FileNotFoundError:
                 self.get_logger().error(f"[{self.robot_namespace}] Graph file not found at '{self.graph_path}'. Cannot become Master.")
                 return
-            except json.JSONDecodeError as e:
+            except serialization.JSONDecodeError as e:
                 self.get_logger().error(f"[{self.robot_namespace}] Error decoding graph JSON: {e}. Cannot become Master.")
                 return
             except Exception as e:
@@ -524,12 +687,31 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
                 return
         else:
             self.get_logger().warn(f"[{self.robot_namespace}] No graph path provided => cannot assign routes as MASTER.")
+
+        # Publisher of the navigation graph, durable so that slaves joining later still get it
+        self.graph_publisher = self.create_publisher(String, '/navigation_graph', self.graph_qos_profile)
+
+        # Subscribe to slave_registration and navigation_status as Master
+        self.slave_registration_subscriber = self.create_subscription(
+            String, '/slave_registration', self.slave_registration_callback, self.registration_qos_profile
+        )
+        self.navigation_status_subscriber = self.create_subscription(
+            String, '/navigation_status', self.navigation_status_callback, self.qos_profile
+        )
+
+        if self.full_graph is not None:
+            # Publish the navigation graph so that other slaves can receive it
+            self.publish_navigation_graph()
+
+            # Compute the global CPP (Chinese Postman Problem) route on the worker thread;
+            # waypoints are assigned to the slaves once it is ready
+            self.compute_global_cpp_route()
         
         # Create a timer to periodically run Master tasks (e.g. checking for timeouts)
         self.master_timer = self.create_timer(self.check_interval, self.master_timer_callback)
         
         # Stop publishing slave heartbeats once we've become Master
-        self.heartbeat_timer.cancel()
+        self.publishing_heartbeat = False
         self.get_logger().info(f"[{self.robot_namespace}] Stopped publishing slave heartbeat.")
         
         # Remove itself from active_slaves, as it is now the Master
@@ -572,10 +754,7 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         """
         Sends a coordinator message indicating this node is the Master.
         """
-        coord_msg = {"type": "COORDINATOR", "sender": self.robot_namespace}
-        msg = String()
-        msg.data = json.dumps(coord_msg)
-        self.coordinator_publisher.publish(msg)
+        self.coordinator_publisher.publish(self.coordinator_msg)
         self.get_logger().info(f"[{self.robot_namespace}] Sent COORDINATOR message.")
 
     # =========================================================================
@@ -587,13 +766,10 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         Checks if slaves are still active based on their last heartbeat timestamp.
         If a slave has not sent a heartbeat within 'self.timeout', it is removed.
         """
-        current_time = time.time()
+        current_time = self.get_clock().now().nanoseconds / 1e9
         with self.active_slaves_lock:
-            # Identify inactive slaves
-            inactive_slaves = [
-                slave_ns for slave_ns, slave in self.slaves.items()
-                if (current_time - slave.last_seen_time) > self.timeout
-            ]
+            # Only the expired deadlines are visited, not every registered slave
+            inactive_slaves = self.pop_timed_out_slaves(current_time)
             for slave_ns in inactive_slaves:
                 del self.slaves[slave_ns]
                 self.get_logger().warn(f"Slave '{slave_ns}' timed out and has been removed.")
@@ -605,8 +781,14 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
     def run(self):
         """
         Spins the node so it can respond to callbacks and timers indefinitely.
+        One thread per callback group: busy callbacks never delay heartbeats.
         """
-        rclpy.spin(self)
+        executor = MultiThreadedExecutor(num_threads=3)
+        executor.add_node(self)
+        try:
+            executor.spin()
+        finally:
+            executor.shutdown()
 
     def destroy_node(self):
         """
@@ -614,6 +796,8 @@ class SimulatedSlaveNavigationNode(Node, MasterCallbacks):
         """
         if self.is_master and self.heartbeat_manager:
             self.heartbeat_manager.stop_publishing()
+        # Do not wait for a CPP route calculation that is still running
+        self.cpp_route_executor.shutdown(wait=False)
         super().destroy_node()
 
 
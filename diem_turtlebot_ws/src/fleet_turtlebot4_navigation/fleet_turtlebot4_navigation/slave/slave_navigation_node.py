@@ -3,13 +3,20 @@
 import rclpy
 from rclpy.node import Node
 from std_msgs.msg import String
-import json
+import sys
 import time
 from threading import Lock, Event
-from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
+from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy, HistoryPolicy
+from rclpy.serialization import serialize_message
+from rclpy.qos_event import SubscriptionEventCallbacks
+from rclpy.duration import Duration
+from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+from rclpy.executors import MultiThreadedExecutor
 
 # For real TurtleBot4 navigation
-from turtlebot4_navigation.turtlebot4_navigator import TurtleBot4Navigator, TaskResult
+from turtlebot4_navigation.turtlebot4_navigator import TurtleBot4Navigator
+from nav2_msgs.action import NavigateToPose
+from action_msgs.msg import GoalStatus
 
 # Possibly needed for graph logic (if you want to handle the graph in MASTER mode):
 import networkx as nx
@@ -21,6 +28,7 @@ from fleet_turtlebot4_navigation.master.master_callbacks import MasterCallbacks
 from fleet_turtlebot4_navigation.master.heartbeat_manager import HeartbeatManager
 from fleet_turtlebot4_navigation.master.waypoint_manager import WaypointManager
 from fleet_turtlebot4_navigation.master.graph_utils import load_full_graph_from_data
+from fleet_turtlebot4_navigation.master import serialization
 
 
 class RealRobotNavigationNode(Node, MasterCallbacks):
@@ -41,14 +49,19 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             robot_namespace (str): Unique namespace for this robot (e.g., 'robot1').
             graph_path (str): Path to the JSON navigation graph (used when becoming MASTER).
         """
+        # The namespace is published verbatim as this slave's identity and the Master does not
+        # strip it, so a namespace with whitespace is rejected here, once, at start-up
+        if any(c.isspace() for c in robot_namespace):
+            raise ValueError(f"Invalid robot namespace {robot_namespace!r}: whitespace is not allowed")
+
         # Name the node 'real_robot_navigation_node' and place it under the robot_namespace
         super().__init__('real_robot_navigation_node', namespace=robot_namespace)
         
         # Initialize MasterCallbacks if you want the master logic
         MasterCallbacks.__init__(self)
 
-        # Store basic parameters
-        self.robot_namespace = robot_namespace
+        # Store basic parameters (the namespace is interned, like the Master's slave keys)
+        self.robot_namespace = sys.intern(robot_namespace)
         self.graph_path = graph_path
         
         # QoS profile (similar to the simulation code)
@@ -56,11 +69,38 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         self.qos_profile.reliability = ReliabilityPolicy.RELIABLE
         self.qos_profile.durability = DurabilityPolicy.VOLATILE
 
+        # Heartbeats only matter for their freshness: keep just the latest one, best effort,
+        # so stale beats never pile up behind a busy callback
+        self.heartbeat_qos_profile = QoSProfile(depth=1)
+        self.heartbeat_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.heartbeat_qos_profile.durability = DurabilityPolicy.VOLATILE
+
+        # Master heartbeats (1 Hz) additionally carry a 2 s deadline, offered by the Master and
+        # requested here, so a missing heartbeat is reported by a QoS event instead of polling
+        self.master_heartbeat_qos_profile = QoSProfile(depth=1)
+        self.master_heartbeat_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.master_heartbeat_qos_profile.durability = DurabilityPolicy.VOLATILE
+        self.master_heartbeat_qos_profile.deadline = Duration(seconds=2.0)
+
+        # Registrations are resent every second, so best effort is enough; the topic is shared
+        # by all slaves, hence a small queue rather than a single slot
+        self.registration_qos_profile = QoSProfile(depth=10)
+        self.registration_qos_profile.reliability = ReliabilityPolicy.BEST_EFFORT
+        self.registration_qos_profile.durability = DurabilityPolicy.VOLATILE
+
+        # The navigation graph is published once by the Master and kept by DDS (latest only),
+        # so a slave that subscribes late still receives it without any republishing
+        self.graph_qos_profile = QoSProfile(depth=1)
+        self.graph_qos_profile.history = HistoryPolicy.KEEP_LAST
+        self.graph_qos_profile.reliability = ReliabilityPolicy.RELIABLE
+        self.graph_qos_profile.durability = DurabilityPolicy.TRANSIENT_LOCAL
+
         # Flags and primary state
         self.is_master = False
-        self.master_alive = True
-        self.last_master_heartbeat = time.time()
+        self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
         self.heartbeat_timeout = 1000.0
+        # Set by the first Master heartbeat: from then on, loss is detected by the deadline event
+        self.master_heartbeat_seen = False
 
         # Declare and read some parameters
         self.declare_parameter('timeout', 5.0)
@@ -76,9 +116,13 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         # Graph / navigation state
         self.graph_received = False
         self.navigation_graph = None
+        # Global graph, loaded from 'graph_path' only if this node becomes Master
+        self.full_graph = None
         self.current_node = None  # start with no known location
         self.is_navigating = False
         self.assigned_waypoints = []
+        # (label, start time, traversed edge) of the goal being executed by Nav2, if any
+        self.pending_navigation = None
         self.navigation_lock = Lock()
 
         # Master data structures
@@ -92,10 +136,20 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         # Timers, events for Bully election
         self.election_in_progress = False
         self.election_event = Event()
+        # Serializes the election -> Master transition across the executor threads
+        self.election_lock = Lock()
 
         # Initialize the real TurtleBot4Navigator for actual motion
         self.navigator = TurtleBot4Navigator()
 
+        # NavigateToPose goal reused for every waypoint: the frame and the orientation
+        # (yaw 0.0, i.e. the identity quaternion) never change, so only the position and
+        # the stamp are filled in per goal. send_goal_async serializes the goal immediately,
+        # so the message can be overwritten as soon as the call returns.
+        self.goal_msg = NavigateToPose.Goal()
+        self.goal_msg.pose.header.frame_id = 'map'
+        self.goal_msg.pose.pose.orientation.w = 1.0
+
         # Minor flags
         self.first_wp_notification_sent = False
 
@@ -103,24 +157,49 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         # Publishers and Subscribers
         ############################
         # SLAVE side: (common topics)
-        self.slave_registration_publisher = self.create_publisher(String, '/slave_registration', self.qos_profile)
-        self.heartbeat_publisher = self.create_publisher(String, '/slave_heartbeat', self.qos_profile)
+        self.slave_registration_publisher = self.create_publisher(String, '/slave_registration', self.registration_qos_profile)
+        self.heartbeat_publisher = self.create_publisher(String, '/slave_heartbeat', self.heartbeat_qos_profile)
         self.status_publisher = self.create_publisher(String, '/navigation_status', self.qos_profile)
 
+        # Registration and heartbeat payloads are constant (the namespace): serialize them once
+        # and publish the raw bytes on every tick, skipping the Python-to-C message conversion
+        namespace_msg = String()
+        namespace_msg.data = self.robot_namespace
+        self.registration_msg = serialize_message(namespace_msg)
+        self.heartbeat_msg = self.registration_msg
+
         self.election_publisher = self.create_publisher(String, '/election', self.qos_profile)
         self.coordinator_publisher = self.create_publisher(String, '/coordinator', self.qos_profile)
+        # Constant payloads (they only carry our namespace), encoded once
+        self.election_msg = String()
+        self.election_msg.data = serialization.dumps({"type": "ELECTION", "sender": self.robot_namespace})
+        self.ok_msg = String()
+        self.ok_msg.data = serialization.dumps({"type": "OK", "sender": self.robot_namespace})
+        self.coordinator_msg = String()
+        self.coordinator_msg.data = serialization.dumps({"type": "COORDINATOR", "sender": self.robot_namespace})
 
         # Publish first waypoint reached if needed
         self.first_wp_reached_pub = self.create_publisher(String, '/first_waypoint_reached', self.qos_profile)
+        self.first_wp_reached_msg = String()
+        self.first_wp_reached_msg.data = serialization.dumps({"robot_namespace": self.robot_namespace})
+
+        # Callback groups: navigation commands get their own group; heartbeats and the tick get
+        # another one, so that they keep being served by the MultiThreadedExecutor (see run())
+        # while other callbacks are busy (e.g. loading the graph or becoming Master), instead of
+        # the Master being declared lost. Everything else stays in the default group.
+        self.heartbeat_callback_group = MutuallyExclusiveCallbackGroup()
+        self.navigation_callback_group = MutuallyExclusiveCallbackGroup()
 
         # SUBSCRIBERS
         # Master heartbeat (to detect Master presence/failure)
         self.master_heartbeat_subscriber = self.create_subscription(
-            String, '/master_heartbeat', self.master_heartbeat_callback, self.qos_profile
+            String, '/master_heartbeat', self.master_heartbeat_callback, self.master_heartbeat_qos_profile,
+            callback_group=self.heartbeat_callback_group,
+            event_callbacks=SubscriptionEventCallbacks(deadline=self.master_heartbeat_deadline_missed)
         )
         # Navigation graph broadcast from Master
         self.graph_subscriber = self.create_subscription(
-            String, '/navigation_graph', self.slave_navigation_graph_callback, self.qos_profile
+            String, '/navigation_graph', self.slave_navigation_graph_callback, self.graph_qos_profile
         )
         # Election messages
         self.election_subscriber = self.create_subscription(
@@ -135,13 +214,20 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             String,
             f'/{self.robot_namespace}/navigation_commands',
             self.slave_navigation_commands_callback,
-            self.qos_profile
+            self.qos_profile,
+            callback_group=self.navigation_callback_group
+        )
+        # Batched first-waypoint assignments broadcast by the Master to all slaves
+        self.navigation_assignments_subscriber = self.create_subscription(
+            String, '/navigation_assignments', self.navigation_assignments_callback, self.qos_profile,
+            callback_group=self.navigation_callback_group
         )
 
-        # Timers
-        self.registration_timer = self.create_timer(1.0, self.publish_registration)
-        self.heartbeat_timer = self.create_timer(1.0, self.publish_heartbeat)
-        self.check_master_timer = self.create_timer(1.0, self.check_master_alive)
+        # Timers: a single 1 Hz tick drives registration, heartbeat and Master checks
+        self.publishing_heartbeat = True
+        self.tick_timer = self.create_timer(
+            1.0, self.tick_callback, callback_group=self.heartbeat_callback_group
+        )
 
         # Debug log: started as slave with no known node
         self.get_logger().info(
@@ -152,49 +238,66 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
     # SLAVE-PART: Publishing & Basic Callbacks
     ###########################################################################
 
+    def tick_callback(self):
+        """
+        Periodic 1 Hz tick: publishes registration and heartbeat (the latter only
+        while we are a SLAVE) and, until the first Master heartbeat arrives, checks
+        whether the Master is alive (afterwards the deadline QoS event takes over).
+        """
+        self.publish_registration()
+        if self.publishing_heartbeat:
+            self.publish_heartbeat()
+        if not self.master_heartbeat_seen:
+            self.check_master_alive()
+
     def publish_registration(self):
         """
         Publishes the robot namespace so the Master knows we exist.
         """
-        msg = String()
-        msg.data = self.robot_namespace
-        self.slave_registration_publisher.publish(msg)
-        self.get_logger().debug(f"[{self.robot_namespace}] Published slave registration.")
+        self.slave_registration_publisher.publish(self.registration_msg)
 
     def publish_heartbeat(self):
         """
         Publishes a heartbeat to inform the Master we're alive.
         """
-        msg = String()
-        msg.data = self.robot_namespace
-        self.heartbeat_publisher.publish(msg)
-        self.get_logger().debug(f"[{self.robot_namespace}] Published slave heartbeat.")
+        self.heartbeat_publisher.publish(self.heartbeat_msg)
 
     def master_heartbeat_callback(self, msg):
         """
-        Resets 'master_alive' each time a Master heartbeat is received.
+        Records the time of each Master heartbeat received.
         """
-        self.master_alive = True
-        self.last_master_heartbeat = time.time()
-        self.get_logger().debug(f"[{self.robot_namespace}] Received master heartbeat.")
+        self.master_heartbeat_seen = True
+        self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Received master heartbeat.")
+
+    def master_heartbeat_deadline_missed(self, event):
+        """
+        QoS event: no Master heartbeat within the deadline (fired once per missed period).
+        Starts an election once the heartbeat has been missing for 'heartbeat_timeout'.
+        """
+        if self.is_master:
+            return
+
+        if (self.get_clock().now().nanoseconds / 1e9 - self.last_master_heartbeat) > self.heartbeat_timeout:
+            self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating election!")
+            self.elect_new_master()
 
     def check_master_alive(self):
         """
         Periodic check to see if the Master is still sending heartbeats.
         If not, we start an election.
+        Only polled until the first Master heartbeat arrives; afterwards the deadline
+        QoS event (master_heartbeat_deadline_missed) detects a lost Master.
         """
         if self.is_master:
             return
 
-        if self.master_alive:
-            # Next loop we consider master_alive = False to see if another heartbeat arrives
-            self.master_alive = False
-        else:
-            # If no heartbeat arrived for 'heartbeat_timeout', start election
-            now = time.time()
-            if (now - self.last_master_heartbeat) > self.heartbeat_timeout:
-                self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating election!")
-                self.elect_new_master()
+        # If no heartbeat arrived for 'heartbeat_timeout', start election
+        now = self.get_clock().now().nanoseconds / 1e9
+        if (now - self.last_master_heartbeat) > self.heartbeat_timeout:
+            self.get_logger().warn(f"[{self.robot_namespace}] Master heartbeat lost => Initiating election!")
+            self.elect_new_master()
 
     ###########################################################################
     # BULLY ALGORITHM (ELECTION)
@@ -205,30 +308,30 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         Initiates the Bully election. 
         If no 'higher' nodes respond, this node becomes Master.
         """
-        if self.election_in_progress:
-            self.get_logger().info(f"[{self.robot_namespace}] Election already in progress.")
-            return
-
-        self.election_in_progress = True
-        self.election_event.clear()
+        # The tick, the Master heartbeat deadline event and election_callback run on different
+        # executor threads: the election is claimed under 'election_lock', so only one runs at a time
+        with self.election_lock:
+            if self.is_master:
+                return
+            if self.election_in_progress:
+                self.get_logger().info(f"[{self.robot_namespace}] Election already in progress.")
+                return
+            self.election_in_progress = True
+            self.election_event.clear()
 
+        # Stops at the first active slave with a higher namespace
         with self.active_slaves_lock:
-            higher_nodes = [ns for ns in self.active_slaves if ns > self.robot_namespace]
+            has_higher_nodes = any(ns > self.robot_namespace for ns in self.active_slaves)
 
-        if not higher_nodes:
+        if not has_higher_nodes:
             self.get_logger().info(f"[{self.robot_namespace}] No higher nodes found. Becoming MASTER!")
-            self.become_master()
-            self.election_in_progress = False
-            self.election_event.set()
+            self.promote_to_master()
             return
 
-        # Send ELECTION messages to higher nodes
-        for node_ns in higher_nodes:
-            election_msg = {"type": "ELECTION", "sender": self.robot_namespace}
-            msg = String()
-            msg.data = json.dumps(election_msg)
-            self.election_publisher.publish(msg)
-            self.get_logger().debug(f"[{self.robot_namespace}] Sent ELECTION to {node_ns}.")
+        # Send the ELECTION message once: '/election' is a broadcast topic read by every higher node
+        self.election_publisher.publish(self.election_msg)
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Sent ELECTION to higher nodes.")
 
         wait_time = 5
         self.get_logger().info(f"[{self.robot_namespace}] Waiting {wait_time}s for OK responses.")
@@ -241,8 +344,17 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
 
         # If no one responded, become Master
         self.get_logger().info(f"[{self.robot_namespace}] No OK received => Becoming MASTER!")
-        self.become_master()
-        self.election_in_progress = False
+        self.promote_to_master()
+
+    def promote_to_master(self):
+        """
+        Ends an election won by this node: becomes Master (at most once) and releases the election.
+        The transition holds 'election_lock', so that concurrent elections cannot run it twice.
+        """
+        with self.election_lock:
+            if not self.is_master:
+                self.become_master()
+            self.election_in_progress = False
         self.election_event.set()
 
     def election_callback(self, msg):
@@ -251,21 +363,18 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         If we have a 'higher' name, we respond with 'OK' and start our own election.
         """
         try:
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             if data.get("type") != "ELECTION":
                 return
             sender = data.get("sender")
             if sender and sender < self.robot_namespace:
                 # We are 'higher', so we say OK and start our own election
-                ok_msg = {"type": "OK", "sender": self.robot_namespace}
-                response = String()
-                response.data = json.dumps(ok_msg)
-                self.election_publisher.publish(response)
+                self.election_publisher.publish(self.ok_msg)
                 self.get_logger().info(
                     f"[{self.robot_namespace}] Received ELECTION from '{sender}', sent OK. Launching our election."
                 )
                 self.elect_new_master()
-        except json.JSONDecodeError as e:
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding ELECTION message: {e}")
 
     def coordinator_callback(self, msg):
@@ -273,18 +382,17 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         Callback for receiving COORDINATOR messages from the new Master.
         """
         try:
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             if data.get("type") != "COORDINATOR":
                 return
             sender = data.get("sender")
             if sender:
                 self.get_logger().info(f"[{self.robot_namespace}] COORDINATOR from '{sender}'. That is the new Master.")
                 self.is_master = False
-                self.master_alive = True
-                self.last_master_heartbeat = time.time()
+                self.last_master_heartbeat = self.get_clock().now().nanoseconds / 1e9
                 self.election_in_progress = False
                 self.election_event.set()
-        except json.JSONDecodeError as e:
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding COORDINATOR message: {e}")
 
     ###########################################################################
@@ -301,11 +409,12 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             return
 
         if self.graph_received:
-            self.get_logger().debug(f"[{self.robot_namespace}] Graph already received, ignoring.")
+            if self.debug_logging:
+                self.get_logger().debug(f"[{self.robot_namespace}] Graph already received, ignoring.")
             return
 
         try:
-            data = json.loads(msg.data)
+            data = serialization.loads(msg.data)
             self.navigation_graph = load_full_graph_from_data(data)  # Provided by your master.graph_utils
             self.graph_received = True
 
@@ -319,11 +428,15 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
                 'traversed_edge': []
             }
             rmsg = String()
-            rmsg.data = json.dumps(ready_data)
+            rmsg.data = serialization.dumps(ready_data)
             self.status_publisher.publish(rmsg)
             self.get_logger().info(f"[{self.robot_namespace}] Graph received, published 'ready' status.")
 
-        except json.JSONDecodeError as e:
+            # The graph is only loaded once: stop receiving (and converting) later publications
+            self.destroy_subscription(self.graph_subscriber)
+            self.graph_subscriber = None
+
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding graph as slave: {e}")
 
     ###########################################################################
@@ -339,11 +452,44 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             return
 
         try:
-            waypoint_data = json.loads(msg.data)
-        except json.JSONDecodeError as e:
+            waypoint_data = serialization.parse_waypoint(serialization.loads(msg.data))
+        except serialization.JSONDecodeError as e:
             self.get_logger().error(f"[{self.robot_namespace}] Error decoding waypoint: {e}")
             return
+        except ValueError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Invalid waypoint: {e}")
+            return
+
+        self.enqueue_waypoint(waypoint_data)
+
+    def navigation_assignments_callback(self, msg):
+        """
+        Callback for the batched assignments broadcast by the Master on '/navigation_assignments'.
+        The message maps each slave namespace to its waypoint: only our own entry is queued.
+        """
+        if self.is_master:
+            return
+
+        try:
+            assignments = serialization.loads(msg.data)
+        except serialization.JSONDecodeError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Error decoding assignments: {e}")
+            return
 
+        waypoint_data = assignments.get(self.robot_namespace)
+        if waypoint_data is None:
+            return
+        try:
+            waypoint_data = serialization.parse_waypoint(waypoint_data)
+        except ValueError as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Invalid waypoint: {e}")
+            return
+        self.enqueue_waypoint(waypoint_data)
+
+    def enqueue_waypoint(self, waypoint_data):
+        """
+        Queues a waypoint received from the Master and starts navigating if idle.
+        """
         # If we don't have a graph, we can't properly navigate
         if not self.graph_received or self.navigation_graph is None:
             self.get_logger().warn(f"[{self.robot_namespace}] No graph available => cannot navigate.")
@@ -352,25 +498,46 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
 
         with self.navigation_lock:
             self.assigned_waypoints.append(waypoint_data)
-            self.get_logger().info(f"[{self.robot_namespace}] Received waypoint: {waypoint_data}")
+            if self.debug_logging:
+                self.get_logger().debug(f"[{self.robot_namespace}] Received waypoint: {waypoint_data}")
             # If not already navigating, start
-            if not self.is_navigating:
+            start_navigation = not self.is_navigating
+            if start_navigation:
                 self.is_navigating = True
-                # In the real code, we navigate one waypoint at a time:
-                wpt = self.assigned_waypoints.pop(0)
-                self.navigate_to_waypoint(wpt)
-                # Potentially continue if multiple waypoints
-                # but we can do a simple approach: once we reach the first, 
-                # we check if there's more, etc.
+
+        if start_navigation:
+            self.execute_waypoints_in_sequence()
 
     ###########################################################################
     # REAL Navigation using TurtleBot4Navigator
     ###########################################################################
-    
+
+    def execute_waypoints_in_sequence(self):
+        """
+        Execute queued waypoints in FIFO order until the queue is empty or a navigation
+        goal is in progress. In the latter case the action result callback resumes the
+        sequence through finish_navigation() once the robot has stopped.
+        """
+        while True:
+            with self.navigation_lock:
+                if not self.assigned_waypoints:
+                    self.is_navigating = False
+                    return
+                wpt = self.assigned_waypoints.pop(0)
+            if self.navigate_to_waypoint(wpt):
+                return
+
     def navigate_to_waypoint(self, waypoint):
         """
-        Replaces 'simulate_navigation' with actual TurtleBot4 navigation calls,
-        using the startToPose(...) and getResult() approach (synchronous-like).
+        Sends a NavigateToPose goal for the waypoint to the Nav2 action server.
+
+        The goal is sent asynchronously: instead of blocking in startToPose() until the
+        robot arrives, the executor keeps serving callbacks and the outcome is handled
+        by on_navigation_goal_response() / on_navigation_result().
+
+        Returns:
+            bool: True if a goal was sent (completion is asynchronous),
+                  False if the waypoint was handled immediately.
         """
         label = waypoint["label"]
         x = waypoint["x"]
@@ -382,93 +549,117 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             self.publish_status("reached", "", 0.0, label, [label, label])
             if not self.first_wp_notification_sent:
                 self.publish_first_waypoint_notification()
-            self.is_navigating = False
-            return
+            return False
 
         # If we are already at the destination
         if self.current_node == label:
             self.get_logger().info(f"[{self.robot_namespace}] Already at '{label}'.")
-            self.is_navigating = False
-            return
+            return False
 
         # If the node doesn't exist in the graph, report an error
         if (self.current_node not in self.navigation_graph.nodes) or (label not in self.navigation_graph.nodes):
             err_msg = f"Current node='{self.current_node}' or destination='{label}' not in the graph."
             self.get_logger().error(f"[{self.robot_namespace}] {err_msg}")
             self.publish_status("error", err_msg, 0.0, label, [])
-            self.is_navigating = False
-            return
+            return False
 
-        # Build the pose (x, y, orientation=0.0)
-        goal_pose = self.navigator.getPoseStamped([x, y], 0.0)
+        # Fill in the pose (x, y, orientation=0.0) of the reusable goal
+        goal_msg = self.goal_msg
+        goal_msg.pose.header.stamp = self.navigator.get_clock().now().to_msg()
+        goal_msg.pose.pose.position.x = float(x)
+        goal_msg.pose.pose.position.y = float(y)
 
-        start_time = time.time()
-        self.publish_status("traversing", "", 0.0, label, [self.current_node, label])
+        trav_edge = [self.current_node, label]
+        self.publish_status("traversing", "", 0.0, label, trav_edge)
         self.get_logger().info(
             f"[{self.robot_namespace}] Navigating from '{self.current_node}' to '{label}'..."
         )
 
         try:
-            # (Optional) Check if the action server is ready.
-            if not self.navigator.nav_to_pose_client.wait_for_server(timeout_sec=5.0):
+            # run() already waited for the action server: this only catches a server that
+            # went away since, without blocking the executor thread
+            if not self.navigator.nav_to_pose_client.server_is_ready():
                 err_message = f"Action server not available to navigate to '{label}'."
                 self.get_logger().error(f"[{self.robot_namespace}] {err_message}")
-                self.publish_status("error", err_message, 0.0, label, [])
-                self.is_navigating = False
-                return
-
-            # Start blocking navigation
-            self.navigator.startToPose(goal_pose)
-
-            # Once navigation completes, measure the total time
-            time_taken = time.time() - start_time
+                # Report the edge announced as traversing, so the Master releases it
+                self.publish_status("error", err_message, 0.0, label, trav_edge)
+                return False
 
-            # Retrieve the final navigation result (TaskResult.SUCCEEDED, etc.)
-            nav_result = self.navigator.getResult()
-
-            if nav_result == TaskResult.SUCCEEDED:
-                # Success
-                self.get_logger().info(
-                    f"[{self.robot_namespace}] Reached '{label}' in {time_taken:.2f}s."
-                )
-                self.current_node = label
-                self.publish_status("reached", "", time_taken, label, [self.current_node, label])
-                
-                if not self.first_wp_notification_sent:
-                    self.publish_first_waypoint_notification()
-            else:
-                # Some failure code (ABORTED, CANCELLED, etc.)
-                error_message = f"Navigation to '{label}' failed with code {nav_result}."
-                self.get_logger().error(f"[{self.robot_namespace}] {error_message}")
-                self.publish_status("error", error_message, time_taken, label, [self.current_node, label])
+            # Send the goal without waiting for the robot to arrive
+            self.pending_navigation = (label, time.time(), trav_edge)
+            send_goal_future = self.navigator.nav_to_pose_client.send_goal_async(goal_msg)
+            send_goal_future.add_done_callback(self.on_navigation_goal_response)
+            return True
 
         except Exception as e:
             error_message = f"Exception while navigating to '{label}': {e}"
             self.get_logger().error(f"[{self.robot_namespace}] {error_message}")
-            self.publish_status("error", error_message, 0.0, label, [self.current_node, label])
+            self.publish_status("error", error_message, 0.0, label, trav_edge)
+            self.pending_navigation = None
+            return False
 
-        # Finished processing this waypoint
-        self.is_navigating = False
-        
-        # # If there are more queued waypoints, continue
-        # with self.navigation_lock:
-        #     if len(self.assigned_waypoints) > 0:
-        #         next_wp = self.assigned_waypoints.pop(0)
-        #         self.is_navigating = True
-        #         self.navigate_to_waypoint(next_wp)
+    def on_navigation_goal_response(self, future):
+        """
+        Done callback of the goal request: waits (asynchronously) for the result of an
+        accepted goal, or reports the failure of a rejected one.
+        """
+        try:
+            goal_handle = future.result()
+        except Exception as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Error sending the navigation goal: {e}")
+            goal_handle = None
+        # A failed or rejected request still ends the pending navigation, as an error
+        if goal_handle is None or not goal_handle.accepted:
+            self.finish_navigation(GoalStatus.STATUS_ABORTED)
+            return
+        goal_handle.get_result_async().add_done_callback(self.on_navigation_result)
 
+    def on_navigation_result(self, future):
+        """
+        Done callback of the goal result, fired when the robot has stopped.
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            self.get_logger().error(f"[{self.robot_namespace}] Error getting the navigation result: {e}")
+            result = None
+        self.finish_navigation(result.status if result is not None else GoalStatus.STATUS_ABORTED)
+
+    def finish_navigation(self, status):
+        """
+        Publishes the outcome of the pending navigation goal, given its final GoalStatus,
+        and continues with the queued waypoints.
+        """
+        label, start_time, trav_edge = self.pending_navigation
+        self.pending_navigation = None
+
+        # Once navigation completes, measure the total time
+        time_taken = time.time() - start_time
+
+        if status == GoalStatus.STATUS_SUCCEEDED:
+            # Success
+            self.get_logger().info(
+                f"[{self.robot_namespace}] Reached '{label}' in {time_taken:.2f}s."
+            )
+            self.current_node = label
+            self.publish_status("reached", "", time_taken, label, trav_edge)
 
+            if not self.first_wp_notification_sent:
+                self.publish_first_waypoint_notification()
+        else:
+            # Some failure code (ABORTED, CANCELED, etc.)
+            error_message = f"Navigation to '{label}' failed with code {status}."
+            self.get_logger().error(f"[{self.robot_namespace}] {error_message}")
+            self.publish_status("error", error_message, time_taken, label, trav_edge)
 
+        self.execute_waypoints_in_sequence()
 
     def publish_first_waypoint_notification(self):
         """
         Publishes a one-time notification that the first waypoint has been reached.
         """
         if not self.first_wp_notification_sent and self.current_node is not None:
-            data = {"robot_namespace": self.robot_namespace}
-            msg = String()
-            msg.data = json.dumps(data)
-            self.first_wp_reached_pub.publish(msg)
+            self.first_wp_reached_pub.publish(self.first_wp_reached_msg)
             self.first_wp_notification_sent = True
             self.get_logger().info(f"[{self.robot_namespace}] Published first_waypoint_reached notification.")
 
@@ -495,9 +686,10 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
             'traversed_edge': trav
         }
         s = String()
-        s.data = json.dumps(st)
+        s.data = serialization.dumps(st)
         self.status_publisher.publish(s)
-        self.get_logger().info(f"[{self.robot_namespace}] Published status: {st}")
+        if self.debug_logging:
+            self.get_logger().debug(f"[{self.robot_namespace}] Published status: {st}")
 
     ###########################################################################
     # BECOMING MASTER
@@ -512,7 +704,7 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         self.get_logger().info(f"[{self.robot_namespace}] => MASTER MODE activated")
 
         # Heartbeat manager (master side)
-        self.heartbeat_manager = HeartbeatManager(self, self.qos_profile)
+        self.heartbeat_manager = HeartbeatManager(self, self.master_heartbeat_qos_profile)
         self.heartbeat_manager.start_publishing()
 
         # Waypoint manager for coordinating edges
@@ -523,33 +715,19 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         self.occupied_edges.clear()
         self.edge_occupants.clear()
 
-        # Subscribe to /slave_registration and /navigation_status as MASTER
-        self.slave_registration_subscriber = self.create_subscription(
-            String, '/slave_registration', self.slave_registration_callback, self.qos_profile
-        )
-        self.navigation_status_subscriber = self.create_subscription(
-            String, '/navigation_status', self.navigation_status_callback, self.qos_profile
-        )
-
+        # Load the graph before subscribing as MASTER: registrations are served on another
+        # executor thread and start the CPP route calculation, which reads 'full_graph'
         if self.graph_path:
             try:
-                with open(self.graph_path, 'r') as f:
-                    graph_data = json.load(f)
+                with open(self.graph_path, 'rb') as f:
+                    graph_data = serialization.loads(f.read())
                 self.full_graph = load_full_graph_from_data(graph_data)
+                self.navigation_graph_msg = None
                 self.get_logger().info(f"[{self.robot_namespace}] (MASTER) Loaded graph from '{self.graph_path}'.")
-
-                # Publish the navigation graph so slaves can receive it
-                self.publish_navigation_graph()
-
-                self.compute_global_cpp_route()
-                self.get_logger().info(f"Global CPP route computed: {self.global_cpp_route}")
-
-                self.waypoint_manager.repartition_and_assign_waypoints()
-
             except FileNotFoundError:
                 self.get_logger().error(f"[{self.robot_namespace}] Graph file not found at '{self.graph_path}'. Cannot become Master.")
                 return
-            except json.JSONDecodeError as e:
+            except serialization.JSONDecodeError as e:
                 self.get_logger().error(f"[{self.robot_namespace}] Error decoding graph JSON: {e}. Cannot become Master.")
                 return
             except Exception as e:
@@ -558,10 +736,28 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         else:
             self.get_logger().warn(f"[{self.robot_namespace}] No graph path => cannot assign routes as MASTER.")
 
+        # Publisher of the navigation graph, durable so that slaves joining later still get it
+        self.graph_publisher = self.create_publisher(String, '/navigation_graph', self.graph_qos_profile)
+
+        # Subscribe to /slave_registration and /navigation_status as MASTER
+        self.slave_registration_subscriber = self.create_subscription(
+            String, '/slave_registration', self.slave_registration_callback, self.registration_qos_profile
+        )
+        self.navigation_status_subscriber = self.create_subscription(
+            String, '/navigation_status', self.navigation_status_callback, self.qos_profile
+        )
+
+        if self.full_graph is not None:
+            # Publish the navigation graph so slaves can receive it
+            self.publish_navigation_graph()
+
+            # Computed on the worker thread; waypoints are assigned once the route is ready
+            self.compute_global_cpp_route()
+
         self.master_timer = self.create_timer(self.check_interval, self.master_timer_callback)
 
         # Stop publishing slave heartbeat
-        self.heartbeat_timer.cancel()
+        self.publishing_heartbeat = False
         self.get_logger().info(f"[{self.robot_namespace}] Stopped publishing slave heartbeat.")
 
         with self.active_slaves_lock:
@@ -597,10 +793,7 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
 
     def send_coordinator_message(self):
         # A method required by MasterCallbacks to broadcast we are the coordinator
-        coord_msg = {"type": "COORDINATOR", "sender": self.robot_namespace}
-        msg = String()
-        msg.data = json.dumps(coord_msg)
-        self.coordinator_publisher.publish(msg)
+        self.coordinator_publisher.publish(self.coordinator_msg)
         self.get_logger().info(f"[{self.robot_namespace}] Sent COORDINATOR message.")
 
     ###########################################################################
@@ -612,12 +805,10 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         Check if slaves are still alive based on heartbeat timestamps.
         Remove them if they time out.
         """
-        current_time = time.time()
+        current_time = self.get_clock().now().nanoseconds / 1e9
         with self.active_slaves_lock:
-            inactive_slaves = [
-                ns for ns, slave_state in self.slaves.items()
-                if (current_time - slave_state.last_seen_time) > self.timeout
-            ]
+            # Only the expired deadlines are visited, not every registered slave
+            inactive_slaves = self.pop_timed_out_slaves(current_time)
             for ns in inactive_slaves:
                 del self.slaves[ns]
                 self.get_logger().warn(f"Slave '{ns}' timed out and has been removed.")
@@ -629,8 +820,21 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
     def run(self):
         """
         Spin the node so it can respond to callbacks indefinitely.
+        One thread per callback group: busy callbacks never delay heartbeats.
+        The Nav2 action server is waited for once here, before spinning, so that
+        waypoints never fail just because its discovery has not completed yet.
         """
-        rclpy.spin(self)
+        while rclpy.ok() and not self.navigator.nav_to_pose_client.wait_for_server(timeout_sec=5.0):
+            self.get_logger().info(f"[{self.robot_namespace}] Waiting for the Nav2 action server...")
+
+        executor = MultiThreadedExecutor(num_threads=4)
+        executor.add_node(self)
+        # The navigator is a separate node: spinning it here completes its action futures
+        executor.add_node(self.navigator)
+        try:
+            executor.spin()
+        finally:
+            executor.shutdown()
 
     def destroy_node(self):
         """
@@ -638,6 +842,8 @@ class RealRobotNavigationNode(Node, MasterCallbacks):
         """
         if self.is_master and self.heartbeat_manager:
             self.heartbeat_manager.stop_publishing()
+        # Do not wait for a CPP route calculation that is still running
+        self.cpp_route_executor.shutdown(wait=False)
         super().destroy_node()
 
 
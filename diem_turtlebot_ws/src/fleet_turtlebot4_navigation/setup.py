@@ -17,7 +17,7 @@ setup(
         # Includi altri file necessari (es. mappe, JSON)
         (os.path.join('share', package_name, 'map'), glob('map/*.json')),
     ],
-    install_requires=['setuptools', 'networkx', 'numpy', 'scikit-learn'],
+    install_requires=['setuptools', 'networkx', 'numpy', 'scipy', 'scikit-learn'],
     zip_safe=True,
     maintainer='beniamino',
     maintainer_email='bennibeniamino@gmail.com',
@@ -296,44 +296,22 @@ def build_initial_graph(nodes, map_info, img, h, k, max_edges_per_node, collisio
         all_distances = all_neighbors_idx[0]  # Distance matrix
         all_indices = all_neighbors_idx[1]    # Neighbor index matrix
     else:
-        # If sklearn is not available, use a less efficient all-pairs approach
+        # If sklearn is not available, use an all-pairs approach, vectorized with NumPy
         N = len(coords)  # Total number of nodes
-        all_indices = []    # List for neighbor indices
-        all_distances = []  # List for neighbor distances
 
-        for i in range(N):
-            dlist = []  # Temporary list for distances and neighbor indices
+        # Euclidean distance between every pair of nodes, shape (N, N)
+        xy = coords.astype(float)
+        all_pairs = np.hypot(xy[:, None, 0] - xy[None, :, 0], xy[:, None, 1] - xy[None, :, 1])
+        # A node is never its own K-NN neighbor
+        np.fill_diagonal(all_pairs, np.inf)
 
-            for j in range(N):
-                if i == j:
-                    continue  # Skip if it's the same node
+        # Take the first k neighbors in ascending distance (stable sort: ties keep index order)
+        knn = np.argsort(all_pairs, axis=1, kind='stable')[:, :min(k, N - 1)]
+        knn_dists = np.take_along_axis(all_pairs, knn, axis=1)
 
-                # Calculate Euclidean distance between node i and node j
-                dist = compute_distance(coords[i][0], coords[i][1],
-                                        coords[j][0], coords[j][1])
-                dlist.append((dist, j))  # Add the tuple (distance, index)
-
-            # Sort the list by ascending distance
-            dlist.sort(key=lambda x: x[0])
-
-            # Take the first k neighbors
-            knn = dlist[:k]
-
-            # Extract only the indices and distances
-            neighbor_indices = [x[1] for x in knn]
-            neighbor_dists = [x[0] for x in knn]
-
-            # For consistency with KDTree, add itself as the first neighbor
-            neighbor_indices = [i] + neighbor_indices
-            neighbor_dists = [0.0] + neighbor_dists
-
-            # Add the indices and distances to their respective lists
-            all_indices.append(neighbor_indices)
-            all_distances.append(neighbor_dists)
-
-        # Convert the lists to NumPy arrays for efficiency
-        all_indices = np.array(all_indices, dtype=int)       # Shape (N, k+1)
-        all_distances = np.array(all_distances, dtype=float)  # Shape (N, k+1)
+        # For consistency with KDTree, add itself as the first neighbor
+        all_indices = np.hstack([np.arange(N)[:, None], knn]).astype(int)         # Shape (N, k+1)
+        all_distances = np.hstack([np.zeros((N, 1)), knn_dists]).astype(float)  # Shape (N, k+1)
 
     # Initialize an adjacency list for each node
     adjacency_list = [[] for _ in range(len(nodes))]
@@ -459,6 +437,10 @@ def connect_disconnected_components(G, nodes, map_info, img, h, collision_tolera
     # Extract origin coordinates for secondary sorting
     origin_x, origin_y, _ = map_info["origin"]
 
+    # Index the node data (label, x, y) by label once, instead of scanning the node list
+    # for every candidate pair
+    nodes_by_label = {nd[0]: nd for nd in nodes}
+
     # Continue adding edges until the graph is fully connected
     while len(components) > 1:
         candidate_pairs = []  # Temporary list for candidate pairs to connect components
@@ -474,8 +456,8 @@ def connect_disconnected_components(G, nodes, map_info, img, h, collision_tolera
                     # Iterate over all nodes in the second component
                     for node_b in component_b:
                         # Extract node data (label, x, y)
-                        node_a_data = next(nd for nd in nodes if nd[0] == node_a)
-                        node_b_data = next(nd for nd in nodes if nd[0] == node_b)
+                        node_a_data = nodes_by_label[node_a]
+                        node_b_data = nodes_by_label[node_b]
 
                         # Calculate the Euclidean distance between the two nodes
                         distance = compute_distance(
@@ -7,9 +7,11 @@ class Config:
     """
     Classe di configurazione per parametri della mappa e del grafo caricati da un file YAML.
     """
-    def __init__(self, config_path, min_feature_size=0.5):
+    def __init__(self, config_path, min_feature_size=0.5, save_debug_images=False):
         self.load_config(config_path)
         self.min_feature_size = min_feature_size
+        # Se True, salva anche le mappe intermedie (PNG) di ogni fase della pipeline
+        self.save_debug_images = save_debug_images
         self.calculate_dynamic_parameters()
 
     def load_config(self, config_path):
@@ -21,6 +21,7 @@ import os
 import argparse
 import logging
 import shutil
+import cv2
 import numpy as np
 # Importing custom modules for configuration, coordinate transformation, image processing,
 # graph creation, and visualization.
@@ -97,8 +98,13 @@ def process_map(config):
 
     # Step 1: Load the original occupancy grid map
     original_map = img_proc.load_map(config.image_path, config.negate)
+    # Intermediate maps are only written on request (--save_debug_images): encoding each
+    # full-resolution PNG costs more than most of the processing steps themselves
+    save_debug_images = config.save_debug_images
+
     # Save the original map as a PNG image for reference
-    img_proc.save_as_png(original_map, os.path.join(map_directory, f"{map_name}_original_map.png"))
+    if save_debug_images:
+        img_proc.save_as_png(original_map, os.path.join(map_directory, f"{map_name}_original_map.png"))
 
     # Step 2: Clean the map to remove noise and irrelevant details
     try:
@@ -109,12 +115,14 @@ def process_map(config):
         return
 
     # Save the cleaned map as a PNG image
-    img_proc.save_as_png(cleaned_map, os.path.join(map_directory, f"{map_name}_cleaned_map.png"))
+    if save_debug_images:
+        img_proc.save_as_png(cleaned_map, os.path.join(map_directory, f"{map_name}_cleaned_map.png"))
 
     # Step 3: Create a binary map from the cleaned map
     binary_map = img_proc.create_binary_map(cleaned_map)
     # Save the binary map as a PNG image
-    img_proc.save_as_png(binary_map, os.path.join(map_directory, f"{map_name}_cleaned_binary_map.png"))
+    if save_debug_images:
+        img_proc.save_as_png(binary_map, os.path.join(map_directory, f"{map_name}_cleaned_binary_map.png"))
 
     # Step 4: Compute the Euclidean distance map from the binary map
     distance_map = img_proc.compute_distance_map(binary_map)
@@ -122,19 +130,27 @@ def process_map(config):
     # Normalize the distance map to enhance visualization
     max_distance = np.max(distance_map)
     if max_distance > 0:
-        distance_map_normalized = (distance_map / max_distance * 255).astype(np.uint8)
+        # The distance map is not needed afterwards: scale it in place (same operations, same
+        # rounding) and cast straight into a uint8 buffer, instead of allocating two float64
+        # temporaries of the full map size
+        np.divide(distance_map, max_distance, out=distance_map)
+        np.multiply(distance_map, 255, out=distance_map)
+        distance_map_normalized = np.empty(distance_map.shape, dtype=np.uint8)
+        np.copyto(distance_map_normalized, distance_map, casting='unsafe')
     else:
         # If the maximum distance is zero, create a zeroed image and log a warning
         distance_map_normalized = np.zeros_like(distance_map, dtype=np.uint8)
         logging.warning("Maximum distance in the distance map is 0. Normalized map set to all zeros.")
     
     # Save the normalized distance map as a PNG image
-    img_proc.save_as_png(distance_map_normalized, os.path.join(map_directory, f"{map_name}_distance_map.png"))
+    if save_debug_images:
+        img_proc.save_as_png(distance_map_normalized, os.path.join(map_directory, f"{map_name}_distance_map.png"))
 
     # Step 5: Skeletonize the Voronoi lines to extract the fundamental navigational pathways
     voronoi_skeleton = img_proc.skeletonize_voronoi(distance_map_normalized)
     # Save the skeletonized Voronoi map as a PNG image
-    img_proc.save_as_png(voronoi_skeleton, os.path.join(map_directory, f"{map_name}_skeleton_voronoi.png"))
+    if save_debug_images:
+        img_proc.save_as_png(voronoi_skeleton, os.path.join(map_directory, f"{map_name}_skeleton_voronoi.png"))
 
     # Initialize the CoordinateTransformer with the cleaned map's dimensions and map parameters
     transformer = CoordinateTransformer(
@@ -187,10 +203,22 @@ if __name__ == "__main__":
                         help='Minimum feature size in meters for morphological operations. Default is 0.5 meters.')
     parser.add_argument('--line_tolerance', type=float, default=0.06, 
                         help='Line tolerance parameter (obsolete).')  # Note: line_tolerance is obsolete
+    parser.add_argument('--save_debug_images', action='store_true',
+                        help='Also save the intermediate maps (original, cleaned, binary, distance, skeleton) as PNG.')
+    parser.add_argument('--num_threads', type=int, default=None,
+                        help='Number of threads used by OpenCV. Default: OpenCV\'s own choice (all available cores).')
     args = parser.parse_args()
 
+    # OpenCV parallelizes the image operations (and releases the GIL) on its own thread pool.
+    # On robots with few or heterogeneous cores, limit it so the pipeline does not compete
+    # with the navigation stack.
+    if args.num_threads is not None:
+        cv2.setNumThreads(max(1, args.num_threads))
+        logging.info(f"OpenCV threads set to {cv2.getNumThreads()}.")
+
     # Load the configuration using the provided YAML file and min_feature_size parameter
-    config = Config(args.config, min_feature_size=args.min_feature_size)
+    config = Config(args.config, min_feature_size=args.min_feature_size,
+                    save_debug_images=args.save_debug_images)
     logging.info("Configuration loaded.")
 
     # Execute the map processing workflow with the loaded configuration
@@ -5,8 +5,34 @@ import numpy as np
 from scipy.ndimage import distance_transform_edt
 from skimage.morphology import skeletonize
 import logging
-from PIL import Image
 import os
+from functools import lru_cache
+
+# Largest distance (in pixels) for which the float32 output of cv2.distanceTransform can be
+# rounded back to the exact Euclidean distance; beyond roughly 885 px the float32 error is
+# larger than the gap between neighbouring square roots. 512 keeps a safety margin.
+EXACT_CV_DISTANCE_LIMIT = 512
+
+
+@lru_cache(maxsize=32)
+def rect_kernel(size):
+    """
+    Returns the square rectangular structuring element of the given size.
+
+    Kernels are cached, so repeated calls to `clean_map` (e.g. when tuning
+    min_feature_size) reuse them instead of rebuilding them. The returned array is
+    shared between callers, so it is made read-only.
+
+    Parameters:
+        size (int): Side of the square kernel in pixels.
+
+    Returns:
+        numpy.ndarray: The structuring element (read-only).
+    """
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
+    kernel.setflags(write=False)
+    return kernel
+
 
 def load_map(image_path, negate):
     """
@@ -24,7 +50,8 @@ def load_map(image_path, negate):
         raise FileNotFoundError(f"Error: unable to open file {image_path}")
     
     if negate:
-        occupancy_grid = cv2.bitwise_not(occupancy_grid)
+        # The freshly loaded image is not shared: invert it in place instead of allocating a copy
+        cv2.bitwise_not(occupancy_grid, dst=occupancy_grid)
         logging.info("Map negation applied.")
     
     return occupancy_grid
@@ -35,7 +62,8 @@ def clean_map(occupancy_grid, config, map_directory, map_name):
     Applies morphological transformations to clean the map.
 
     Parameters:
-        occupancy_grid (numpy.ndarray): The grayscale image of the map.
+        occupancy_grid (numpy.ndarray): The grayscale (uint8) image of the map. Views such as
+            crops are made C-contiguous once, before the morphological steps.
         config (Config): Configuration object with dynamic parameters.
         map_directory (str): Directory to save intermediate maps.
         map_name (str): Base name for saving maps.
@@ -45,39 +73,49 @@ def clean_map(occupancy_grid, config, map_directory, map_name):
     """
     logging.info("Starting map cleaning process.")
 
+    # Make the input contiguous once (no copy if it already is), so that neither OpenCV
+    # nor the buffers below have to deal with a strided view at every step
+    occupancy_grid = np.ascontiguousarray(occupancy_grid)
+
+    # The four steps ping-pong between two preallocated buffers (OpenCV's `dst` argument)
+    # instead of allocating a new full-size image at every step
+    buf_a = np.empty_like(occupancy_grid)
+    buf_b = np.empty_like(occupancy_grid)
+
     # Step 1: Morphological closing to fill small gaps and connect fragmented regions
     kernel_close_size = config.kernel_close_size
     logging.debug(f"Using kernel_close_size: {kernel_close_size}")
-    kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_close_size, kernel_close_size))
-    closed_map = cv2.morphologyEx(occupancy_grid, cv2.MORPH_CLOSE, kernel_close)
+    kernel_close = rect_kernel(kernel_close_size)
+    closed_map = cv2.morphologyEx(occupancy_grid, cv2.MORPH_CLOSE, kernel_close, dst=buf_a)
     logging.debug("Applied morphological closing.")
     
     # Step 2: Dilation to expand prominent features and enhance connectivity
     kernel_dilate_size = config.kernel_dilate_size
     logging.debug(f"Using kernel_dilate_size: {kernel_dilate_size}") 
-    kernel_dilate = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_dilate_size, kernel_dilate_size))
-    dilated_map = cv2.dilate(closed_map, kernel_dilate, iterations=1)
+    kernel_dilate = rect_kernel(kernel_dilate_size)
+    dilated_map = cv2.dilate(closed_map, kernel_dilate, dst=buf_b, iterations=1)
     logging.debug("Applied dilation.")
     
     # Step 3: Opening to remove small noise artifacts while preserving major structures
     kernel_open_size = config.kernel_open_size
     logging.debug(f"Using kernel_open_size: {kernel_open_size}")
-    kernel_open = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_open_size, kernel_open_size))
-    opened_map = cv2.morphologyEx(dilated_map, cv2.MORPH_OPEN, kernel_open)
+    kernel_open = rect_kernel(kernel_open_size)
+    opened_map = cv2.morphologyEx(dilated_map, cv2.MORPH_OPEN, kernel_open, dst=buf_a)
     logging.debug("Applied opening.")
     
     # Step 4: Erosion to contract features and eliminate residual noise
     kernel_erode_size = config.kernel_erode_size
     logging.debug(f"Using kernel_erode_size: {kernel_erode_size}")
-    kernel_erode = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_erode_size, kernel_erode_size))
-    final_map = cv2.erode(opened_map, kernel_erode, iterations=1)
+    kernel_erode = rect_kernel(kernel_erode_size)
+    final_map = cv2.erode(opened_map, kernel_erode, dst=buf_b, iterations=1)
     logging.debug("Applied erosion.")
     
-    # Save the final cleaned map as a PNG image
-    save_as_png(final_map, os.path.join(map_directory, f"{map_name}_final_cleaned_map.png"))
+    # Save the final cleaned map as a PNG image (intermediate output, only on request)
+    if config.save_debug_images:
+        save_as_png(final_map, os.path.join(map_directory, f"{map_name}_final_cleaned_map.png"))
     
-    # Check if the final map is empty (all pixels are zero)
-    if not np.any(final_map):
+    # Check if the final map is empty (all pixels are zero), with OpenCV's SIMD pixel count
+    if cv2.countNonZero(final_map) == 0:
         logging.error("Final cleaned map is empty. Please check the input map and parameters.")
         raise ValueError("Final cleaned map is empty.")
     
@@ -114,11 +152,28 @@ def compute_distance_map(binary_map):
     # Compute the Euclidean distance transform
     # This function calculates the distance transform of the input, by replacing each foreground (non-zero) element,
     # with its shortest distance to the background (any zero-valued element).
-    # In addition to the distance transform, the feature transform can be calculated. 
-    # In this case the index of the closest background element to each foreground element is returned in a separate array. 
-    # For more information refer to: scipy.ndimage.distance_transform_edt documentation
-
-    distance_map = distance_transform_edt(binary_map)
+    # A map without any background pixel has no defined distance in OpenCV, so it goes to scipy directly.
+    if cv2.countNonZero(binary_map) == binary_map.size:
+        distance_map = distance_transform_edt(binary_map)
+        logging.debug("Computed Euclidean distance map (scipy, no background pixels).")
+        return distance_map
+
+    # With DIST_MASK_PRECISE OpenCV computes the exact Euclidean transform (Felzenszwalb's linear-time
+    # algorithm) in C++, considerably faster than scipy.ndimage.distance_transform_edt.
+    # For more information refer to: cv2.distanceTransform documentation
+    distance_map = cv2.distanceTransform(binary_map, cv2.DIST_L2, cv2.DIST_MASK_PRECISE).astype(np.float64)
+
+    if distance_map.max() > EXACT_CV_DISTANCE_LIMIT:
+        # Too far from any obstacle for the float32 result to be corrected exactly.
+        distance_map = distance_transform_edt(binary_map)
+        logging.debug("Computed Euclidean distance map (scipy, distances beyond the float32 limit).")
+        return distance_map
+
+    # OpenCV returns float32 distances. Every exact distance is the square root of an integer
+    # (squared pixel offsets), so up to EXACT_CV_DISTANCE_LIMIT rounding the squares recovers the
+    # exact float64 values that scipy's transform produces; the normalized map and the skeleton
+    # are therefore unchanged.
+    np.sqrt(np.rint(distance_map * distance_map, out=distance_map), out=distance_map)
     logging.debug("Computed Euclidean distance map.")
     return distance_map
 
@@ -147,10 +202,17 @@ def save_as_png(image, filename):
         filename (str): The path to the file to save the image.
     """
     # Ensure the image is in uint8 format
-    if image.dtype != np.uint8:
-        image_to_save = (image * 255).astype(np.uint8)
-    else:
+    if image.dtype == np.uint8:
         image_to_save = image
-    # Convert the NumPy array to a PIL Image and save as PNG
-    Image.fromarray(image_to_save).save(filename, format="PNG")
+    elif image.dtype == bool:
+        # Binary masks (e.g. the skeleton) are scaled straight into a uint8 buffer,
+        # without the intermediate integer array of (image * 255)
+        image_to_save = np.empty(image.shape, dtype=np.uint8)
+        np.multiply(image, 255, out=image_to_save, casting='unsafe')
+    else:
+        image_to_save = (image * 255).astype(np.uint8)
+    # Encode with OpenCV's libpng bindings, which release the GIL, at a low compression
+    # level: these are debugging outputs, so encoding speed matters more than file size
+    if not cv2.imwrite(filename, image_to_save, [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+        raise IOError(f"Error: unable to write file {filename}")
     logging.info(f"Image saved at {filename}")